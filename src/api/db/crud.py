@@ -1,11 +1,11 @@
 """CRUD operations for database models."""
 
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, case, func, insert, or_, select
 
-from src.api.db.models import Artifact, Rating, LineageEdge, Event
+from src.api.db.models import Artifact, Rating, LineageEdge, Event, generate_uuid
 
 
 # ============ Artifact CRUD ============
@@ -36,6 +36,27 @@ def create_artifact(
     return artifact
 
 
+def bulk_create_artifacts(db: Session, rows: List[dict]) -> List[str]:
+    """
+    Create several artifacts with a single INSERT.
+
+    Args:
+        db: Database session
+        rows: Artifact column values (type, name, url, and optionally the
+            other Artifact columns) for each new artifact
+
+    Returns:
+        The new artifact IDs, in input order
+    """
+    if not rows:
+        return []
+
+    rows = [{**row, "id": row.get("id") or generate_uuid()} for row in rows]
+    db.execute(insert(Artifact), rows)
+    db.commit()
+    return [row["id"] for row in rows]
+
+
 def get_artifact(db: Session, artifact_id: str) -> Optional[Artifact]:
     """Get an artifact by ID."""
     return db.query(Artifact).filter(Artifact.id == artifact_id).first()
@@ -211,34 +232,103 @@ def add_lineage_edge(db: Session, parent_id: str, child_id: str) -> LineageEdge:
 
 def get_parents(db: Session, artifact_id: str) -> List[Artifact]:
     """Get all parent artifacts of an artifact."""
-    edges = db.query(LineageEdge).filter(LineageEdge.child_id == artifact_id).all()
-    parent_ids = [edge.parent_id for edge in edges]
-    return db.query(Artifact).filter(Artifact.id.in_(parent_ids)).all()
+    return db.query(Artifact).join(
+        LineageEdge, LineageEdge.parent_id == Artifact.id
+    ).filter(LineageEdge.child_id == artifact_id).distinct().all()
+
+
+def get_parents_with_latest_rating(db: Session, artifact_id: str) -> dict:
+    """
+    Get each parent of an artifact with its most recent net_score in one query.
+
+    Returns:
+        Dict mapping parent artifact_id -> latest net_score (None if unrated)
+    """
+    parent_ids = db.query(LineageEdge.parent_id).filter(
+        LineageEdge.child_id == artifact_id
+    ).subquery()
+
+    ranked = db.query(
+        Rating.artifact_id,
+        Rating.net_score,
+        func.row_number().over(
+            partition_by=Rating.artifact_id,
+            order_by=Rating.created_at.desc(),
+        ).label("rank"),
+    ).filter(Rating.artifact_id.in_(parent_ids.select())).subquery()
+
+    rows = db.query(Artifact.id, ranked.c.net_score).join(
+        LineageEdge, LineageEdge.parent_id == Artifact.id
+    ).outerjoin(
+        ranked, (ranked.c.artifact_id == Artifact.id) & (ranked.c.rank == 1)
+    ).filter(LineageEdge.child_id == artifact_id).all()
+    return {parent_id: net_score for parent_id, net_score in rows}
 
 
 def get_children(db: Session, artifact_id: str) -> List[Artifact]:
     """Get all child artifacts of an artifact."""
-    edges = db.query(LineageEdge).filter(LineageEdge.parent_id == artifact_id).all()
-    child_ids = [edge.child_id for edge in edges]
-    return db.query(Artifact).filter(Artifact.id.in_(child_ids)).all()
+    return db.query(Artifact).join(
+        LineageEdge, LineageEdge.child_id == Artifact.id
+    ).filter(LineageEdge.parent_id == artifact_id).distinct().all()
+
+
+def get_lineage(db: Session, artifact_id: str) -> Tuple[List[Artifact], List[Artifact]]:
+    """
+    Get the direct parents and children of an artifact in one query.
+
+    Returns:
+        Tuple of (parents, children), each without duplicates
+    """
+    rows = db.query(Artifact, LineageEdge.child_id).join(
+        LineageEdge,
+        or_(
+            and_(LineageEdge.child_id == artifact_id, LineageEdge.parent_id == Artifact.id),
+            and_(LineageEdge.parent_id == artifact_id, LineageEdge.child_id == Artifact.id),
+        ),
+    ).all()
 
+    parents: Dict[str, Artifact] = {}
+    children: Dict[str, Artifact] = {}
+    for artifact, child_id in rows:
+        if child_id == artifact_id:
+            parents[artifact.id] = artifact
+        else:
+            children[artifact.id] = artifact
+    return list(parents.values()), list(children.values())
+
+
+def _ancestor_ids(artifact_id: str):
+    """Recursive CTE of the ids of all ancestors (parents, their parents, ...)."""
+    ancestors = select(LineageEdge.parent_id.label("id")).where(
+        LineageEdge.child_id == artifact_id
+    ).cte("ancestors", recursive=True)
+    # UNION (not UNION ALL) dedupes diamonds and terminates on cycles
+    return ancestors.union(
+        select(LineageEdge.parent_id).join(ancestors, LineageEdge.child_id == ancestors.c.id)
+    )
 
-def get_all_dependencies(db: Session, artifact_id: str, visited: Optional[set] = None) -> List[Artifact]:
-    """Recursively get all dependencies (parents and their parents) of an artifact."""
-    if visited is None:
-        visited = set()
 
-    if artifact_id in visited:
-        return []
-    visited.add(artifact_id)
+def get_all_dependencies(db: Session, artifact_id: str) -> List[Artifact]:
+    """
+    Get all dependencies (parents and their parents) of an artifact.
 
-    parents = get_parents(db, artifact_id)
-    all_deps = list(parents)
+    Walks the lineage graph with a single recursive query; each dependency
+    appears once even if it is reachable through several paths.
+    """
+    ancestors = _ancestor_ids(artifact_id)
+    return db.query(Artifact).filter(
+        Artifact.id.in_(select(ancestors.c.id)),
+        Artifact.id != artifact_id,
+    ).all()
 
-    for parent in parents:
-        all_deps.extend(get_all_dependencies(db, parent.id, visited))
 
-    return all_deps
+def get_dependencies_size(db: Session, artifact_id: str) -> int:
+    """Get the total size_bytes of all dependencies of an artifact in one query."""
+    ancestors = _ancestor_ids(artifact_id)
+    return db.query(func.coalesce(func.sum(Artifact.size_bytes), 0)).filter(
+        Artifact.id.in_(select(ancestors.c.id)),
+        Artifact.id != artifact_id,
+    ).scalar()
 
 
 def get_lineage_edges(db: Session, artifact_id: str) -> List[LineageEdge]:
@@ -289,36 +379,33 @@ def cleanup_old_events(db: Session, older_than_hours: int = 24):
 
 def get_health_stats(db: Session) -> dict:
     """Get aggregated health statistics from events in the last hour."""
-    events = get_events_last_hour(db)
+    one_hour_ago = datetime.utcnow() - timedelta(hours=1)
+
+    # Aggregate per (method, endpoint) in the database: K grouped rows
+    # instead of one ORM object per event
+    rows = db.query(
+        Event.method,
+        Event.endpoint,
+        func.count(Event.id),
+        func.sum(case((Event.status_code >= 400, 1), else_=0)),  # 4xx and 5xx
+        func.avg(Event.latency_ms),
+    ).filter(
+        Event.timestamp >= one_hour_ago
+    ).group_by(Event.method, Event.endpoint).all()
 
     request_counts: dict = {}
     error_counts: dict = {}
-    latencies: dict = {}
-
-    for event in events:
-        key = f"{event.method} {event.endpoint}"
+    avg_latency_ms: dict = {}
 
-        # Count requests
-        request_counts[key] = request_counts.get(key, 0) + 1
-
-        # Count errors (4xx and 5xx)
-        if event.status_code >= 400:
-            error_counts[key] = error_counts.get(key, 0) + 1
-
-        # Track latencies for averaging
-        if key not in latencies:
-            latencies[key] = []
-        latencies[key].append(event.latency_ms)
-
-    # Compute average latencies
-    avg_latency_ms = {
-        key: sum(vals) / len(vals) if vals else 0.0
-        for key, vals in latencies.items()
-    }
+    for method, endpoint, count, errors, avg_latency in rows:
+        key = f"{method} {endpoint}"
+        request_counts[key] = count
+        if errors:
+            error_counts[key] = errors
+        avg_latency_ms[key] = float(avg_latency or 0.0)
 
     return {
         "request_counts": request_counts,
         "error_counts": error_counts,
         "avg_latency_ms": avg_latency_ms,
     }
-
@@ -3,15 +3,23 @@
 import os
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import StaticPool
 
 # Database URL - use SQLite file in project root
 DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///./registry.db")
 
+# An in-memory SQLite database (used by the test suite) lives only as long as
+# its connection, so every session must share one connection
+_engine_kwargs = {}
+if DATABASE_URL in ("sqlite://", "sqlite:///:memory:"):
+    _engine_kwargs["poolclass"] = StaticPool
+
 # Create engine with SQLite-specific settings
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # Needed for SQLite
     echo=False,
+    **_engine_kwargs,
 )
 
 # Session factory
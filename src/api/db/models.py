@@ -2,14 +2,18 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from src.api.db.database import Base
 
 
+# Source of primary-key UUIDs; tests swap in a cheaper deterministic one
+_uuid_factory = uuid.uuid4
+
+
 def generate_uuid() -> str:
     """Generate a new UUID string."""
-    return str(uuid.uuid4())
+    return str(_uuid_factory())
 
 
 class Artifact(Base):
@@ -26,6 +30,11 @@ class Artifact(Base):
     size_bytes = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Type-filtered listings (newest first) read rows in index order, no sort
+    __table_args__ = (
+        Index("ix_artifact_type_created_desc", "type", created_at.desc()),
+    )
+
     # Relationships
     ratings = relationship("Rating", back_populates="artifact", cascade="all, delete-orphan")
     parent_edges = relationship(
@@ -83,6 +92,11 @@ class Rating(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Latest-rating lookups (per artifact, newest first) read one index entry
+    __table_args__ = (
+        Index("ix_rating_artifact_created_desc", "artifact_id", created_at.desc()),
+    )
+
     # Relationship
     artifact = relationship("Artifact", back_populates="ratings")
 
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 
 class ArtifactType(str, Enum):
@@ -52,7 +52,21 @@ class ArtifactListResponse(BaseModel):
     total: int
 
 
-class SizeScore(BaseModel):
+class RoundedScoreModel(BaseModel):
+    """Base for score/latency responses: floats are rounded to 3 places on output.
+
+    Metric computation keeps full precision; rounding happens once here at
+    serialization instead of at every intermediate step.
+    """
+
+    @field_serializer("*", when_used="json")
+    def _round_floats(self, value: Any) -> Any:
+        if isinstance(value, float):
+            return round(value, 3)
+        return value
+
+
+class SizeScore(RoundedScoreModel):
     """Size scores for different hardware targets."""
     raspberry_pi: float = 0.0
     jetson_nano: float = 0.0
@@ -60,7 +74,7 @@ class SizeScore(BaseModel):
     aws_server: float = 0.0
 
 
-class RatingResponse(BaseModel):
+class RatingResponse(RoundedScoreModel):
     """Response from rating an artifact."""
     artifact_id: str
     name: str
@@ -214,7 +228,7 @@ class ArtifactRegEx(BaseModel):
     )
 
 
-class ModelRating(BaseModel):
+class ModelRating(RoundedScoreModel):
     """Model rating per OpenAPI spec (BASELINE)."""
     name: str
     category: str
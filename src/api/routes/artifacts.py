@@ -2,6 +2,7 @@
 
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from src.api.db.database import get_db, reset_database
@@ -227,7 +228,7 @@ async def upload_artifact_spec(
     if artifact_type == ArtifactType.MODEL:
         # HuggingFace model - compute metrics
         try:
-            result = compute_all_metrics(url)
+            result = await run_in_threadpool(compute_all_metrics, url)
             metrics = result["metrics"]
             latencies = result["latencies"]
             hf_data = result.get("hf_data", {})
@@ -2,6 +2,7 @@
 
 import re
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from src.api.db.database import get_db
@@ -240,7 +241,7 @@ async def ingest_artifact(
     else:
         # HuggingFace model - use full metrics computation
         try:
-            result = compute_all_metrics(url)
+            result = await run_in_threadpool(compute_all_metrics, url)
             metrics = result["metrics"]
             latencies = result["latencies"]
             hf_data = result.get("hf_data", {})
@@ -1,6 +1,5 @@
 """Lineage, cost, and license check endpoints."""
 
-import re
 import requests
 from typing import Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -21,6 +20,7 @@ from src.api.models.schemas import (
     SimpleLicenseCheckRequest,
     ArtifactCostEntry,
 )
+from src.api.services.license import fetch_github_license
 
 router = APIRouter()
 
@@ -45,9 +45,8 @@ async def get_artifact_lineage(
             detail=f"Artifact {artifact_id} not found",
         )
 
-    # Get parents and children
-    parents = crud.get_parents(db, artifact_id)
-    children = crud.get_children(db, artifact_id)
+    # Get parents and children (single query)
+    parents, children = crud.get_lineage(db, artifact_id)
 
     return LineageResponse(
         artifact_id=artifact_id,
@@ -137,11 +136,8 @@ async def get_artifact_cost(
 
     own_size = artifact.size_bytes or 0
 
-    # Get all dependencies recursively (avoids duplicates via visited set)
-    dependencies = crud.get_all_dependencies(db, artifact_id)
-
-    # Sum dependency sizes
-    dep_size = sum(d.size_bytes or 0 for d in dependencies)
+    # Sum sizes of all dependencies in the database (each counted once)
+    dep_size = crud.get_dependencies_size(db, artifact_id)
 
     return CostResponse(
         artifact_id=artifact_id,
@@ -197,46 +193,6 @@ def normalize_license(license_str: Optional[str]) -> Optional[str]:
     return mappings.get(license_lower, license_lower)
 
 
-def fetch_github_license(github_url: str) -> Optional[str]:
-    """Fetch license from GitHub repository."""
-    # Extract owner/repo from URL
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", github_url)
-    if not match:
-        return None
-
-    owner, repo = match.groups()
-    repo = repo.rstrip(".git")
-
-    try:
-        # Use GitHub API to get license
-        api_url = f"https://api.github.com/repos/{owner}/{repo}/license"
-        response = requests.get(api_url, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("license", {}).get("spdx_id")
-    except Exception:
-        pass
-
-    # Fallback: try to fetch LICENSE file directly
-    try:
-        raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/LICENSE"
-        response = requests.get(raw_url, timeout=10)
-        if response.status_code == 200:
-            content = response.text.lower()
-            if "mit license" in content:
-                return "MIT"
-            elif "apache" in content and "2.0" in content:
-                return "Apache-2.0"
-            elif "gnu general public license" in content:
-                if "version 3" in content:
-                    return "GPL-3.0"
-                return "GPL-2.0"
-    except Exception:
-        pass
-
-    return None
-
-
 @router.post("/license-check", response_model=LicenseCheckResponse)
 async def check_license_compatibility(
     request: LicenseCheckRequest,
@@ -1,6 +1,7 @@
 """Rating endpoint for computing artifact trust metrics."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from src.api.db.database import get_db
@@ -11,6 +12,11 @@ from src.api.services.metrics import compute_all_metrics
 router = APIRouter()
 
 
+def _spec_latency(seconds):
+    """Latency for the spec response: rounded to ms, never reported as 0."""
+    return max(round(seconds or 0, 3), 0.001)
+
+
 @router.post(
     "/artifacts/{artifact_type}/{artifact_id}/rating",
     response_model=RatingResponse,
@@ -42,8 +48,8 @@ async def rate_artifact(
             detail=f"Artifact {artifact_id} of type {artifact_type.value} not found",
         )
 
-    # Compute metrics
-    result = compute_all_metrics(artifact.url, db=db, artifact_id=artifact_id)
+    # Compute metrics (network-bound, so run off the event loop)
+    result = await run_in_threadpool(compute_all_metrics, artifact.url, db=db, artifact_id=artifact_id)
     metrics = result["metrics"]
     latencies = result["latencies"]
 
@@ -182,28 +188,28 @@ async def get_model_rating_spec(
         name=artifact.name,
         category="MODEL",
         net_score=rating.net_score,
-        net_score_latency=rating.net_score_latency or 0.001,
+        net_score_latency=_spec_latency(rating.net_score_latency),
         ramp_up_time=rating.ramp_up_time,
-        ramp_up_time_latency=rating.ramp_up_time_latency or 0.001,
+        ramp_up_time_latency=_spec_latency(rating.ramp_up_time_latency),
         bus_factor=rating.bus_factor,
-        bus_factor_latency=rating.bus_factor_latency or 0.001,
+        bus_factor_latency=_spec_latency(rating.bus_factor_latency),
         performance_claims=rating.performance_claims,
-        performance_claims_latency=rating.performance_claims_latency or 0.001,
+        performance_claims_latency=_spec_latency(rating.performance_claims_latency),
         license=rating.license,
-        license_latency=rating.license_latency or 0.001,
+        license_latency=_spec_latency(rating.license_latency),
         dataset_and_code_score=rating.dataset_and_code_score,
-        dataset_and_code_score_latency=rating.dataset_and_code_score_latency or 0.001,
+        dataset_and_code_score_latency=_spec_latency(rating.dataset_and_code_score_latency),
         dataset_quality=rating.dataset_quality,
-        dataset_quality_latency=rating.dataset_quality_latency or 0.001,
+        dataset_quality_latency=_spec_latency(rating.dataset_quality_latency),
         code_quality=rating.code_quality,
-        code_quality_latency=rating.code_quality_latency or 0.001,
+        code_quality_latency=_spec_latency(rating.code_quality_latency),
         reproducibility=rating.reproducibility,
-        reproducibility_latency=rating.reproducibility_latency or 0.001,
+        reproducibility_latency=_spec_latency(rating.reproducibility_latency),
         reviewedness=rating.reviewedness,
-        reviewedness_latency=rating.reviewedness_latency or 0.001,
+        reviewedness_latency=_spec_latency(rating.reviewedness_latency),
         tree_score=rating.treescore,
-        tree_score_latency=rating.tree_score_latency or 0.001,
+        tree_score_latency=_spec_latency(rating.tree_score_latency),
         size_score=SizeScore(**rating.size_score),
-        size_score_latency=rating.size_score_latency or 0.001,
+        size_score_latency=_spec_latency(rating.size_score_latency),
     )
 
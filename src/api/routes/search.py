@@ -4,6 +4,7 @@ Security (STRIDE - DoS): Rate-limited to prevent abuse of expensive regex operat
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
 from sqlalchemy.orm import Session
@@ -106,6 +107,20 @@ def is_safe_regex(pattern: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=512)
+def _compile_search_regex(pattern: str) -> Optional[re.Pattern]:
+    """
+    Validate and compile a user search pattern, cached per pattern string.
+
+    Repeated queries skip both the is_safe_regex scan and compilation.
+    Returns None if the pattern is rejected as unsafe; raises re.error if it
+    is invalid (exceptions are not cached).
+    """
+    if not is_safe_regex(pattern):
+        return None
+    return re.compile(pattern, re.IGNORECASE)
+
+
 @router.get("/artifacts/search", response_model=SearchResponse)
 async def search_artifacts(
     request: Request,
@@ -123,21 +138,19 @@ async def search_artifacts(
     - Returns 400 for malicious/invalid patterns
     - Rate limited to 30 requests/minute per IP (DoS protection)
     """
-    # Validate regex pattern safety
-    if not is_safe_regex(query):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid or potentially malicious regex pattern",
-        )
-
-    # Try to compile the regex
+    # Validate and compile the regex (cached per pattern)
     try:
-        pattern = re.compile(query, re.IGNORECASE)
+        pattern = _compile_search_regex(query)
     except re.error as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid regex pattern: {str(e)}",
         )
+    if pattern is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or potentially malicious regex pattern",
+        )
 
     # Get all artifacts (filtered by type if specified)
     type_filter = artifact_type.value if artifact_type else None
@@ -214,21 +227,19 @@ async def search_by_regex(
     """
     regex_pattern = request.regex
 
-    # Validate regex pattern safety
-    if not is_safe_regex(regex_pattern):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid or potentially malicious regex pattern",
-        )
-
-    # Try to compile the regex
+    # Validate and compile the regex (cached per pattern)
     try:
-        pattern = re.compile(regex_pattern, re.IGNORECASE)
+        pattern = _compile_search_regex(regex_pattern)
     except re.error as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid regex pattern: {str(e)}",
         )
+    if pattern is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or potentially malicious regex pattern",
+        )
 
     # Get all artifacts
     all_artifacts = crud.list_artifacts(db, limit=1000)
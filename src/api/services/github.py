@@ -2,24 +2,64 @@
 
 import os
 import re
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from typing import Optional, Tuple, Dict, Any
+from urllib3.util.retry import Retry
 
 # GitHub API base URL
 GITHUB_API = "https://api.github.com"
+GITHUB_GRAPHQL = f"{GITHUB_API}/graphql"
 
-# Get token from environment (optional, for higher rate limits)
-GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+# In-process cache of successful API responses; entries expire when the TTL
+# bucket rolls over (several models often link the same repository)
+GITHUB_CACHE_TTL = 3600  # Seconds
+GITHUB_CACHE_SIZE = 2048
+
+# Last ETag and body per request; a 304 reply to If-None-Match reuses the body
+# and does not count against the rate limit
+_etags: Dict[Tuple[str, tuple], Tuple[str, Any]] = {}
+_etags_lock = threading.Lock()  # Review lookups read and write _etags from worker threads
+
+# Per-PR review lookups run concurrently on this pool (threads start on demand;
+# kept separate from the metrics pool so nested submits can't deadlock)
+_review_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="github-io")
+
+# Most recent merged PRs sampled for reviewedness (limits API calls)
+_MAX_MERGED_PRS = 20
+
+# owner/repo from https:// (github.com/) or SSH (github.com:) URLs
+_REPO_URL_RE = re.compile(r"github\.com[/:]([^/]+)/([^/]+)")
+
+# GitHub repo links embedded in model card text
+_CARD_GITHUB_RE = re.compile(r"https?://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+")
+
+# Shared session so repeated API calls reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+))
+
+
+_BASE_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "TrustworthyModelRegistry/2.0",
+}
 
 
 def get_github_headers() -> Dict[str, str]:
-    """Get headers for GitHub API requests."""
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "TrustworthyModelRegistry/2.0",
-    }
-    if GITHUB_TOKEN:
-        headers["Authorization"] = f"token {GITHUB_TOKEN}"
+    """Get headers for GitHub API requests (a fresh dict callers may extend)."""
+    headers = dict(_BASE_HEADERS)
+    # Token is optional (higher rate limits); read per call so it can change at runtime
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"token {token}"
     return headers
 
 
@@ -30,31 +70,62 @@ def extract_repo_info(url: str) -> Optional[Tuple[str, str]]:
     Returns:
         Tuple of (owner, repo) or None if not a valid GitHub URL
     """
-    patterns = [
-        r"github\.com/([^/]+)/([^/]+)",
-        r"github\.com:([^/]+)/([^/]+)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            owner, repo = match.groups()
-            repo = repo.rstrip(".git").rstrip("/")
-            return owner, repo
+    match = _REPO_URL_RE.search(url)
+    if not match:
+        return None
+
+    owner, repo = match.groups()
+    return owner, repo.removesuffix(".git")
 
-    return None
+
+def _get_json(path: str, params: Optional[Dict[str, Any]] = None, timeout: int = 10) -> Any:
+    """GET a GitHub API path and return the decoded JSON (cached per TTL bucket)."""
+    bucket = int(time.time() // GITHUB_CACHE_TTL)
+    return _fetch_json_cached(path, tuple(sorted((params or {}).items())), timeout, bucket)
+
+
+@lru_cache(maxsize=GITHUB_CACHE_SIZE)
+def _fetch_json_cached(path: str, params: Tuple[Tuple[str, Any], ...], timeout: int, bucket: int) -> Any:
+    """
+    Fetch a GitHub API path, memoized per TTL bucket.
+
+    Raises on failure so that errors are never cached. Callers must not
+    mutate the returned value (it is shared between cache hits).
+    """
+    key = (path, params)
+    headers = get_github_headers()
+    with _etags_lock:
+        known = _etags.get(key)
+    if known is not None:
+        headers["If-None-Match"] = known[0]
+
+    response = _session.get(
+        f"{GITHUB_API}{path}",
+        headers=headers,
+        params=dict(params) or None,
+        timeout=timeout,
+    )
+    if response.status_code == 304 and known is not None:
+        return known[1]
+    if response.status_code != 200:
+        raise RuntimeError(f"GitHub API returned {response.status_code}")
+
+    data = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        with _etags_lock:
+            if key not in _etags and len(_etags) >= GITHUB_CACHE_SIZE:
+                _etags.pop(next(iter(_etags)))  # Drop the oldest entry
+            _etags[key] = (etag, data)
+    return data
 
 
 def get_repo_info(owner: str, repo: str) -> Optional[Dict[str, Any]]:
     """Get repository information from GitHub API."""
     try:
-        url = f"{GITHUB_API}/repos/{owner}/{repo}"
-        response = requests.get(url, headers=get_github_headers(), timeout=10)
-        if response.status_code == 200:
-            return response.json()
+        return dict(_get_json(f"/repos/{owner}/{repo}"))
     except Exception:
-        pass
-    return None
+        return None
 
 
 def get_pull_requests(owner: str, repo: str, state: str = "all", per_page: int = 100) -> list:
@@ -71,39 +142,73 @@ def get_pull_requests(owner: str, repo: str, state: str = "all", per_page: int =
         List of pull request data
     """
     try:
-        url = f"{GITHUB_API}/repos/{owner}/{repo}/pulls"
         params = {"state": state, "per_page": per_page}
-        response = requests.get(url, headers=get_github_headers(), params=params, timeout=15)
-        if response.status_code == 200:
-            return response.json()
+        return list(_get_json(f"/repos/{owner}/{repo}/pulls", params, timeout=15))
     except Exception:
-        pass
-    return []
+        return []
 
 
 def get_pr_reviews(owner: str, repo: str, pr_number: int) -> list:
     """Get reviews for a specific pull request."""
     try:
-        url = f"{GITHUB_API}/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
-        response = requests.get(url, headers=get_github_headers(), timeout=10)
-        if response.status_code == 200:
-            return response.json()
+        return list(_get_json(f"/repos/{owner}/{repo}/pulls/{pr_number}/reviews"))
     except Exception:
-        pass
-    return []
+        return []
 
 
 def get_commits(owner: str, repo: str, per_page: int = 100) -> list:
     """Get recent commits for a repository."""
     try:
-        url = f"{GITHUB_API}/repos/{owner}/{repo}/commits"
         params = {"per_page": per_page}
-        response = requests.get(url, headers=get_github_headers(), params=params, timeout=15)
-        if response.status_code == 200:
-            return response.json()
+        return list(_get_json(f"/repos/{owner}/{repo}/commits", params, timeout=15))
     except Exception:
-        pass
-    return []
+        return []
+
+
+# Review counts for recent merged PRs in one request (vs. one REST call per PR)
+_REVIEWEDNESS_QUERY = """
+query($owner: String!, $repo: String!, $first: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequests(states: MERGED, first: $first, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        reviews(states: [APPROVED, CHANGES_REQUESTED, COMMENTED]) { totalCount }
+      }
+    }
+  }
+}
+"""
+
+
+def graphql_repo_reviewedness(owner: str, repo: str) -> Optional[Tuple[int, int]]:
+    """
+    Count reviewed and total merged PRs (most recent _MAX_MERGED_PRS) with one GraphQL query.
+
+    The GraphQL API requires authentication, so this returns None when
+    GITHUB_TOKEN is unset, on any request failure, or if the repository
+    is not found.
+
+    Returns:
+        Tuple of (reviewed PRs, merged PRs) or None
+    """
+    if not os.environ.get("GITHUB_TOKEN"):
+        return None
+    try:
+        response = _session.post(
+            GITHUB_GRAPHQL,
+            headers=get_github_headers(),
+            json={"query": _REVIEWEDNESS_QUERY, "variables": {"owner": owner, "repo": repo, "first": _MAX_MERGED_PRS}},
+            timeout=15,
+        )
+        if response.status_code != 200:
+            return None
+        repository = (response.json().get("data") or {}).get("repository")
+        if not repository:
+            return None
+        prs = repository["pullRequests"]["nodes"]
+        reviewed = sum(1 for pr in prs if pr["reviews"]["totalCount"] > 0)
+        return reviewed, len(prs)
+    except Exception:
+        return None
 
 
 def compute_reviewedness_for_repo(github_url: str) -> float:
@@ -127,6 +232,13 @@ def compute_reviewedness_for_repo(github_url: str) -> float:
 
     owner, repo = repo_info
 
+    # Fast path: one GraphQL request covers every merged PR's reviews
+    counts = graphql_repo_reviewedness(owner, repo)
+    if counts and counts[1]:
+        reviewed_prs, total_merged_prs = counts
+        return round(reviewed_prs / total_merged_prs, 3)
+
+    # REST fallback (no token, GraphQL failure, or no merged PRs)
     # Get repository info
     repo_data = get_repo_info(owner, repo)
     if not repo_data:
@@ -143,38 +255,24 @@ def compute_reviewedness_for_repo(github_url: str) -> float:
             return 0.1  # Some code exists but no PR workflow
         return -1.0
 
-    # Count PRs with reviews
-    reviewed_prs = 0
-    total_merged_prs = 0
-
-    for pr in prs:
-        # Only count merged PRs
-        if not pr.get("merged_at"):
-            continue
-
-        total_merged_prs += 1
-        pr_number = pr.get("number")
-
-        # Check if PR has reviews
-        reviews = get_pr_reviews(owner, repo, pr_number)
-
-        # Count as reviewed if has at least one approved or commented review
-        has_review = any(
-            r.get("state") in ("APPROVED", "CHANGES_REQUESTED", "COMMENTED")
-            for r in reviews
-        )
-
-        if has_review:
-            reviewed_prs += 1
-
-        # Limit API calls
-        if total_merged_prs >= 20:
-            break
-
+    # Only count merged PRs
+    merged_prs = [pr for pr in prs if pr.get("merged_at")][:_MAX_MERGED_PRS]
+    total_merged_prs = len(merged_prs)
     if total_merged_prs == 0:
         # PRs exist but none are merged
         return 0.2
 
+    # Fetch each PR's reviews concurrently over the pooled session
+    all_reviews = _review_pool.map(
+        lambda pr: get_pr_reviews(owner, repo, pr.get("number")), merged_prs
+    )
+
+    # Count as reviewed if has at least one approved or commented review
+    reviewed_prs = sum(
+        any(r.get("state") in ("APPROVED", "CHANGES_REQUESTED", "COMMENTED") for r in reviews)
+        for reviews in all_reviews
+    )
+
     # Calculate fraction
     reviewedness = reviewed_prs / total_merged_prs
     return round(reviewedness, 3)
@@ -204,10 +302,9 @@ def find_github_url_for_model(hf_data: Dict[str, Any]) -> Optional[str]:
 
     # Check model card text for GitHub links
     card_text = hf_data.get("card", "") or ""
-    github_pattern = r"https?://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+"
-    matches = re.findall(github_pattern, card_text)
-    if matches:
-        return matches[0]
+    match = _CARD_GITHUB_RE.search(card_text)
+    if match:
+        return match.group(0)
 
     # Check tags
     tags = hf_data.get("tags", []) or []
@@ -215,13 +312,5 @@ def find_github_url_for_model(hf_data: Dict[str, Any]) -> Optional[str]:
         if "github.com" in tag:
             return tag
 
-    # Check siblings for .git files or references
-    siblings = hf_data.get("siblings", []) or []
-    for sibling in siblings:
-        filename = sibling.get("rfilename", "")
-        if ".git" in filename or "github" in filename.lower():
-            # This might be a git submodule reference
-            pass
-
     return None
 
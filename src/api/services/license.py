@@ -2,8 +2,32 @@
 
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from typing import Optional, Tuple
 
+# Shared session so license lookups reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+# owner and repo from a GitHub URL; a trailing ".git" is not part of the repo
+_GITHUB_REPO_RE = re.compile(r"github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/|$)")
+
+# LICENSE file locations tried when the API has no license, in priority order
+_LICENSE_FILE_PATHS = tuple(
+    f"{branch}/{filename}"
+    for branch in ("main", "master")
+    for filename in ("LICENSE", "LICENSE.md", "LICENSE.txt")
+)
+
+# Only the start of a LICENSE file is read; the identifying title, version
+# line, or grant text is always near the top
+_LICENSE_HEAD_BYTES = 8192
+
+# Raw-file probes run concurrently on this pool (threads start on demand)
+_probe_pool = ThreadPoolExecutor(max_workers=len(_LICENSE_FILE_PATHS), thread_name_prefix="license-io")
+
 
 # License compatibility mapping (simplified)
 # Maps license -> set of compatible licenses
@@ -29,7 +53,83 @@ LICENSE_COMPATIBILITY = {
     "cc-by-sa-4.0": {"cc-by-sa-4.0"},
 }
 
+# Symmetric closure of LICENSE_COMPATIBILITY: (artifact, target) -> message,
+# so check_compatibility needs one lookup. A direct entry's wording wins
+# over the reversed one.
+_COMPATIBLE_PAIRS = {
+    (target, base): f"{base} is compatible with {target}"
+    for base, compatible in LICENSE_COMPATIBILITY.items()
+    for target in compatible
+}
+_COMPATIBLE_PAIRS.update({
+    (base, target): f"{base} is compatible with {target}"
+    for base, compatible in LICENSE_COMPATIBILITY.items()
+    for target in compatible
+})
+
+
+# Common license name variants -> standard identifier (exact, lowercased)
+_LICENSE_ALIASES = {
+    # MIT variants
+    "mit license": "mit",
+    "mit": "mit",
+    "expat": "mit",
+
+    # Apache variants
+    "apache 2.0": "apache-2.0",
+    "apache-2.0": "apache-2.0",
+    "apache license 2.0": "apache-2.0",
+    "apache license, version 2.0": "apache-2.0",
+
+    # BSD variants
+    "bsd-2-clause": "bsd-2-clause",
+    "bsd 2-clause": "bsd-2-clause",
+    "simplified bsd": "bsd-2-clause",
+    "bsd-3-clause": "bsd-3-clause",
+    "bsd 3-clause": "bsd-3-clause",
+    "new bsd": "bsd-3-clause",
+    "modified bsd": "bsd-3-clause",
+
+    # GPL variants
+    "gpl-2.0": "gpl-2.0",
+    "gpl 2.0": "gpl-2.0",
+    "gnu gpl v2": "gpl-2.0",
+    "gpl-3.0": "gpl-3.0",
+    "gpl 3.0": "gpl-3.0",
+    "gnu gpl v3": "gpl-3.0",
+    "gnu general public license v3.0": "gpl-3.0",
+
+    # AGPL
+    "agpl-3.0": "agpl-3.0",
+    "gnu agpl v3": "agpl-3.0",
+
+    # LGPL variants
+    "lgpl-2.1": "lgpl-2.1",
+    "gnu lgpl v2.1": "lgpl-2.1",
+    "lgpl-3.0": "lgpl-3.0",
+    "gnu lgpl v3": "lgpl-3.0",
+
+    # Public domain
+    "unlicense": "unlicense",
+    "public domain": "unlicense",
+    "cc0-1.0": "cc0-1.0",
+    "cc0 1.0": "cc0-1.0",
+
+    # Creative Commons
+    "cc-by-4.0": "cc-by-4.0",
+    "cc by 4.0": "cc-by-4.0",
+    "cc-by-sa-4.0": "cc-by-sa-4.0",
+    "cc by-sa 4.0": "cc-by-sa-4.0",
+
+    # Other
+    "isc": "isc",
+    "isc license": "isc",
+    "mpl-2.0": "mpl-2.0",
+    "mozilla public license 2.0": "mpl-2.0",
+}
+
 
+@lru_cache(maxsize=4096)
 def normalize_license(license_str: Optional[str]) -> Optional[str]:
     """
     Normalize license string to a standard identifier.
@@ -44,68 +144,7 @@ def normalize_license(license_str: Optional[str]) -> Optional[str]:
         return None
 
     license_lower = license_str.lower().strip()
-
-    # Common mappings from various formats
-    mappings = {
-        # MIT variants
-        "mit license": "mit",
-        "mit": "mit",
-        "expat": "mit",
-
-        # Apache variants
-        "apache 2.0": "apache-2.0",
-        "apache-2.0": "apache-2.0",
-        "apache license 2.0": "apache-2.0",
-        "apache license, version 2.0": "apache-2.0",
-
-        # BSD variants
-        "bsd-2-clause": "bsd-2-clause",
-        "bsd 2-clause": "bsd-2-clause",
-        "simplified bsd": "bsd-2-clause",
-        "bsd-3-clause": "bsd-3-clause",
-        "bsd 3-clause": "bsd-3-clause",
-        "new bsd": "bsd-3-clause",
-        "modified bsd": "bsd-3-clause",
-
-        # GPL variants
-        "gpl-2.0": "gpl-2.0",
-        "gpl 2.0": "gpl-2.0",
-        "gnu gpl v2": "gpl-2.0",
-        "gpl-3.0": "gpl-3.0",
-        "gpl 3.0": "gpl-3.0",
-        "gnu gpl v3": "gpl-3.0",
-        "gnu general public license v3.0": "gpl-3.0",
-
-        # AGPL
-        "agpl-3.0": "agpl-3.0",
-        "gnu agpl v3": "agpl-3.0",
-
-        # LGPL variants
-        "lgpl-2.1": "lgpl-2.1",
-        "gnu lgpl v2.1": "lgpl-2.1",
-        "lgpl-3.0": "lgpl-3.0",
-        "gnu lgpl v3": "lgpl-3.0",
-
-        # Public domain
-        "unlicense": "unlicense",
-        "public domain": "unlicense",
-        "cc0-1.0": "cc0-1.0",
-        "cc0 1.0": "cc0-1.0",
-
-        # Creative Commons
-        "cc-by-4.0": "cc-by-4.0",
-        "cc by 4.0": "cc-by-4.0",
-        "cc-by-sa-4.0": "cc-by-sa-4.0",
-        "cc by-sa 4.0": "cc-by-sa-4.0",
-
-        # Other
-        "isc": "isc",
-        "isc license": "isc",
-        "mpl-2.0": "mpl-2.0",
-        "mozilla public license 2.0": "mpl-2.0",
-    }
-
-    return mappings.get(license_lower, license_lower)
+    return _LICENSE_ALIASES.get(license_lower, license_lower)
 
 
 def fetch_github_license(github_url: str) -> Optional[str]:
@@ -119,17 +158,16 @@ def fetch_github_license(github_url: str) -> Optional[str]:
         License SPDX identifier or None
     """
     # Extract owner/repo from URL
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", github_url)
+    match = _GITHUB_REPO_RE.search(github_url)
     if not match:
         return None
 
     owner, repo = match.groups()
-    repo = repo.rstrip(".git")
 
     # Try GitHub API first
     try:
         api_url = f"https://api.github.com/repos/{owner}/{repo}/license"
-        response = requests.get(api_url, timeout=10, headers={
+        response = _session.get(api_url, timeout=10, headers={
             "Accept": "application/vnd.github.v3+json"
         })
         if response.status_code == 200:
@@ -139,20 +177,50 @@ def fetch_github_license(github_url: str) -> Optional[str]:
     except requests.RequestException:
         pass
 
-    # Fallback: Try to detect from LICENSE file content
+    # Fallback: Try to detect from LICENSE file content (all locations are
+    # probed at once; the first existing one in priority order wins)
+    futures = [
+        _probe_pool.submit(_fetch_raw_file, f"https://raw.githubusercontent.com/{owner}/{repo}/{path}")
+        for path in _LICENSE_FILE_PATHS
+    ]
+    for future in futures:
+        text = future.result()
+        if text is not None:
+            for pending in futures:
+                pending.cancel()
+            return detect_license_from_content(text)
+
+    return None
+
+
+def _fetch_raw_file(url: str) -> Optional[str]:
+    """Fetch the start of a raw file's text, or None if missing or unreachable."""
     try:
-        for branch in ["main", "master"]:
-            for filename in ["LICENSE", "LICENSE.md", "LICENSE.txt"]:
-                raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{filename}"
-                response = requests.get(raw_url, timeout=10)
-                if response.status_code == 200:
-                    return detect_license_from_content(response.text)
+        response = _session.get(url, timeout=(2, 5), stream=True)
+        try:
+            if response.status_code == 200:
+                # iter_content (not raw.read) so mid-body read errors are
+                # raised as requests exceptions
+                head = next(response.iter_content(_LICENSE_HEAD_BYTES), b"")
+                return head.decode(response.encoding or "utf-8", errors="ignore")
+        finally:
+            response.close()
     except requests.RequestException:
         pass
-
     return None
 
 
+# Signature phrases in LICENSE file text, in priority order (lowercased)
+_CONTENT_SIGNATURES = (
+    ("mit license", "mit"),
+    ("permission is hereby granted, free of charge", "mit"),
+    ("apache license", "apache-2.0"),
+    ("bsd 2-clause", "bsd-2-clause"),
+    ("bsd 3-clause", "bsd-3-clause"),
+    ("this is free and unencumbered software", "unlicense"),
+)
+
+
 def detect_license_from_content(content: str) -> Optional[str]:
     """
     Detect license type from LICENSE file content.
@@ -165,41 +233,25 @@ def detect_license_from_content(content: str) -> Optional[str]:
     """
     content_lower = content.lower()
 
-    # Simple content-based detection
-    patterns = [
-        ("mit license", "mit"),
-        ("permission is hereby granted, free of charge", "mit"),
-        ("apache license", "apache-2.0"),
-        ("version 2.0", None),  # Marker for Apache
-        ("gnu general public license", None),  # Need to check version
-        ("gnu lesser general public license", None),
-        ("bsd 2-clause", "bsd-2-clause"),
-        ("bsd 3-clause", "bsd-3-clause"),
-        ("this is free and unencumbered software", "unlicense"),
-    ]
-
-    detected = None
-    for pattern, license_id in patterns:
-        if pattern in content_lower:
-            if license_id:
-                detected = license_id
-                break
-
-    # Check GPL version
+    # GPL family: the version decides the identifier, and LGPL (whose text
+    # also references the GPL) wins over GPL
+    if "gnu lesser general public license" in content_lower:
+        if "version 3" in content_lower:
+            return "lgpl-3.0"
+        if "version 2.1" in content_lower:
+            return "lgpl-2.1"
     if "gnu general public license" in content_lower:
         if "version 3" in content_lower:
-            detected = "gpl-3.0"
-        elif "version 2" in content_lower:
-            detected = "gpl-2.0"
+            return "gpl-3.0"
+        if "version 2" in content_lower:
+            return "gpl-2.0"
 
-    # Check LGPL version
-    if "gnu lesser general public license" in content_lower:
-        if "version 3" in content_lower:
-            detected = "lgpl-3.0"
-        elif "version 2.1" in content_lower:
-            detected = "lgpl-2.1"
+    # Simple content-based detection: first matching signature wins
+    for pattern, license_id in _CONTENT_SIGNATURES:
+        if pattern in content_lower:
+            return license_id
 
-    return detected
+    return None
 
 
 def check_compatibility(
@@ -230,16 +282,10 @@ def check_compatibility(
     if norm_artifact == norm_target:
         return True, f"Licenses match: {norm_artifact}"
 
-    # Check compatibility map
-    compatible_set = LICENSE_COMPATIBILITY.get(norm_artifact, set())
-
-    if norm_target in compatible_set:
-        return True, f"{norm_artifact} is compatible with {norm_target}"
-
-    # Check reverse compatibility
-    reverse_compatible = LICENSE_COMPATIBILITY.get(norm_target, set())
-    if norm_artifact in reverse_compatible:
-        return True, f"{norm_target} is compatible with {norm_artifact}"
+    # Check compatibility in either direction
+    message = _COMPATIBLE_PAIRS.get((norm_artifact, norm_target))
+    if message:
+        return True, message
 
     return False, f"{norm_artifact} may not be compatible with {norm_target}"
 
@@ -9,20 +9,30 @@ import json
 import logging
 import uuid
 from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 # Configure logging
 LOG_DIR = Path(os.environ.get("LOG_DIR", "/tmp/api_logs"))
 LOG_DIR.mkdir(parents=True, exist_ok=True)
+LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BYTES", 50 * 1024 * 1024))  # 50 MB per file
+LOG_BACKUP_COUNT = int(os.environ.get("LOG_BACKUP_COUNT", 5))
 
 # Create a dedicated logger for requests
 request_logger = logging.getLogger("api.requests")
 request_logger.setLevel(logging.DEBUG)
 
 # File handler - logs all requests to a file (JSON format for CloudWatch)
+# Rotated to bound disk usage; opened lazily on the first write
 log_file = LOG_DIR / "requests.log"
-file_handler = logging.FileHandler(log_file)
+file_handler = RotatingFileHandler(
+    log_file,
+    maxBytes=LOG_MAX_BYTES,
+    backupCount=LOG_BACKUP_COUNT,
+    encoding="utf-8",
+    delay=True,
+)
 file_handler.setLevel(logging.DEBUG)
 file_handler.setFormatter(logging.Formatter(
     '%(asctime)s | %(levelname)s | %(message)s'
@@ -59,25 +69,28 @@ def log_request(
     if request_id is None:
         request_id = generate_request_id()
     
-    log_entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "request_id": request_id,
-        "method": method,
-        "path": path,
-        "client_ip": client_ip or "unknown",
-        "user_agent": user_agent or "unknown",
-        "body": body,
-        "query_params": query_params,
-    }
-    
     # Log human-readable format with security-relevant info
-    request_logger.info(
-        f"REQUEST: {method} {path} | id={request_id} | ip={client_ip or 'unknown'} | "
-        f"ua={user_agent[:50] if user_agent else 'unknown'}... | body={json.dumps(body) if body else 'None'}"
-    )
+    # (lazy %-args; %.50s truncates the User-Agent without slicing)
+    if request_logger.isEnabledFor(logging.INFO):
+        request_logger.info(
+            "REQUEST: %s %s | id=%s | ip=%s | ua=%.50s... | body=%s",
+            method, path, request_id, client_ip or "unknown", user_agent or "unknown",
+            json.dumps(body) if body else "None",
+        )
     
     # Also log structured JSON for CloudWatch/SIEM ingestion
-    request_logger.debug(f"REQUEST_JSON: {json.dumps(log_entry)}")
+    if request_logger.isEnabledFor(logging.DEBUG):
+        log_entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "request_id": request_id,
+            "method": method,
+            "path": path,
+            "client_ip": client_ip or "unknown",
+            "user_agent": user_agent or "unknown",
+            "body": body,
+            "query_params": query_params,
+        }
+        request_logger.debug("REQUEST_JSON: %s", json.dumps(log_entry))
 
 
 def log_response(
@@ -89,10 +102,13 @@ def log_response(
     latency_ms: Optional[int] = None,
 ):
     """Log an outgoing response with timing information."""
+    if not request_logger.isEnabledFor(logging.INFO):
+        return
     latency_str = f" | latency={latency_ms}ms" if latency_ms else ""
     request_logger.info(
-        f"RESPONSE: {method} {path} | id={request_id or 'unknown'} | "
-        f"status={status_code}{latency_str} | body={json.dumps(body)[:500] if body else 'None'}"
+        "RESPONSE: %s %s | id=%s | status=%s%s | body=%.500s",
+        method, path, request_id or "unknown", status_code, latency_str,
+        json.dumps(body) if body else "None",
     )
 
 
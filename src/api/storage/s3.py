@@ -1,8 +1,12 @@
-"""S3 storage adapter for artifact blob storage."""
+"""S3 storage adapter for artifact blob storage.
 
+boto3 (~150ms to import) is loaded on first client use rather than at import
+time, so code paths that never touch S3 don't pay for it.
+"""
+
+import io
 import os
 from typing import Optional
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
 # S3 configuration from environment variables
@@ -10,16 +14,39 @@ S3_BUCKET = os.environ.get("S3_BUCKET", "trustworthy-model-registry")
 S3_REGION = os.environ.get("AWS_REGION", "us-east-1")
 S3_ENDPOINT_URL = os.environ.get("S3_ENDPOINT_URL")  # For local testing with moto/localstack
 
+# Client tuning: a larger connection pool for concurrent uploads and
+# adaptive retries so throttling backs off instead of failing the request
+S3_CLIENT_CONFIG = {
+    "max_pool_connections": 64,
+    "retries": {"max_attempts": 3, "mode": "adaptive"},
+    "tcp_keepalive": True,
+    "signature_version": "s3v4",
+}
+
+# Blobs above this size (e.g. model weights) are uploaded as concurrent multipart parts
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_TRANSFER_CONFIG = {
+    "multipart_threshold": MULTIPART_THRESHOLD,
+    "multipart_chunksize": MULTIPART_THRESHOLD,
+    "max_concurrency": 16,
+    "use_threads": True,
+}
+
 # Initialize S3 client
 _s3_client = None
+_transfer_config = None
 
 
 def get_s3_client():
     """Get or create S3 client (lazy initialization)."""
     global _s3_client
     if _s3_client is None:
+        import boto3
+        from botocore.config import Config
+
         kwargs = {
             "region_name": S3_REGION,
+            "config": Config(**S3_CLIENT_CONFIG),
         }
         if S3_ENDPOINT_URL:
             kwargs["endpoint_url"] = S3_ENDPOINT_URL
@@ -32,6 +59,16 @@ def get_s3_client():
     return _s3_client
 
 
+def get_transfer_config():
+    """Get or create the multipart TransferConfig (lazy initialization)."""
+    global _transfer_config
+    if _transfer_config is None:
+        from boto3.s3.transfer import TransferConfig
+
+        _transfer_config = TransferConfig(**S3_TRANSFER_CONFIG)
+    return _transfer_config
+
+
 def upload_object(key: str, data: bytes, content_type: str = "application/octet-stream") -> str:
     """
     Upload an object to S3.
@@ -52,12 +89,26 @@ def upload_object(key: str, data: bytes, content_type: str = "application/octet-
         raise RuntimeError("S3 client not configured (missing credentials)")
 
     try:
-        client.put_object(
-            Bucket=S3_BUCKET,
-            Key=key,
-            Body=data,
-            ContentType=content_type,
-        )
+        if len(data) > MULTIPART_THRESHOLD:
+            from boto3.exceptions import S3UploadFailedError
+
+            try:
+                client.upload_fileobj(
+                    io.BytesIO(data),
+                    S3_BUCKET,
+                    key,
+                    ExtraArgs={"ContentType": content_type},
+                    Config=get_transfer_config(),
+                )
+            except S3UploadFailedError as e:
+                raise RuntimeError(f"Failed to upload to S3: {e}")
+        else:
+            client.put_object(
+                Bucket=S3_BUCKET,
+                Key=key,
+                Body=data,
+                ContentType=content_type,
+            )
         return key
     except ClientError as e:
         raise RuntimeError(f"Failed to upload to S3: {e}")
@@ -9,49 +9,178 @@ SRC = os.path.join(ROOT, "src")
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
+# Phase 2 setup: keep the API's database in RAM (no file I/O or fsyncs).
+# Must be set before src.api.db.database is first imported.
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
 import pytest
 
 
 # ============ Phase 2 API Fixtures ============
 
-@pytest.fixture
-def db_session():
-    """Create a database session for testing CRUD operations directly."""
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
+@pytest.fixture(scope="session", autouse=True)
+def _sequential_ids():
+    """
+    Generate row ids from a counter instead of uuid4 for the test run.
+
+    Ids keep the UUID shape, skip the os.urandom call per insert, and make
+    failures reproducible.
+    """
+    import itertools
+    from src.api.db import models
+
+    counter = itertools.count(1)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(models, "_uuid_factory", lambda: f"00000000-0000-0000-0000-{next(counter):012x}")
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_metrics_cache(tmp_path_factory):
+    """Keep the on-disk metrics cache in a per-run directory, not /tmp/metrics_cache."""
+    from src.api.services import metrics
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(metrics, "METRICS_CACHE_DIR", str(tmp_path_factory.mktemp("metrics_cache")))
+        mp.setattr(metrics, "_metrics_cache", None)
+        yield
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Create the in-memory test database and its schema once per session."""
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.pool import StaticPool
     from src.api.db.database import Base
     from src.api.db.models import Artifact, Rating, LineageEdge, Event
 
-    # Use in-memory SQLite for test isolation
     engine = create_engine(
-        "sqlite:///:memory:",
+        "sqlite://",
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINTs; let
+    # SQLAlchemy emit BEGIN itself so per-test rollback works
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
-    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = TestSession()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_connection(db_engine, monkeypatch):
+    """
+    Run each test inside an outer transaction that is rolled back afterwards.
+
+    The app's engine and session factory are pointed at this connection, so
+    route, middleware, and test sessions all share it; their commits only
+    release SAVEPOINTs and nothing outlives the test.
+    """
+    from sqlalchemy.orm import sessionmaker
+    from src.api.db import database
+
+    connection = db_engine.connect()
+    transaction = connection.begin()
+
+    monkeypatch.setattr(database, "engine", connection)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+    ))
+
+    yield connection
+
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_session(db_connection):
+    """Create a database session for testing CRUD operations directly."""
+    from src.api.db import database
+
+    session = database.SessionLocal()
 
     yield session
 
     session.close()
-    Base.metadata.drop_all(bind=engine)
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    from fastapi.testclient import TestClient
+@pytest.fixture(scope="session")
+def app():
+    """
+    The FastAPI app, shared by every test.
+
+    src.api.main builds its routes and Pydantic schemas once at import, so
+    tests reuse that instance instead of constructing a new one.
+    """
     from src.api.main import app
-    from src.api.db.database import create_tables, reset_database
 
-    # Reset database for clean test state
-    reset_database()
+    return app
+
+
+@pytest.fixture(scope="session")
+def session_client(app):
+    """
+    A single TestClient for the whole run.
+
+    Entering it once runs the app lifespan and starts the transport/portal
+    thread a single time; per-test isolation comes from db_connection.
+    """
+    from fastapi.testclient import TestClient
 
     with TestClient(app) as test_client:
         yield test_client
 
-    # Cleanup after test
-    reset_database()
+
+@pytest.fixture
+def client(app, session_client, db_connection):
+    """Test client for the FastAPI app, backed by a rolled-back transaction."""
+    yield session_client
+
+    # The app and client are shared, so don't let per-test state leak
+    app.dependency_overrides.clear()
+    session_client.cookies.clear()
+
+
+@pytest.fixture(scope="session")
+def crud_app():
+    """
+    A bare app with only the artifacts router mounted.
+
+    No lifespan, logging/auth middleware, or per-request Event insert; for
+    tests that only exercise artifact CRUD routes.
+    """
+    from fastapi import FastAPI
+    from src.api.routes import artifacts
+
+    crud_app = FastAPI()
+    crud_app.include_router(artifacts.router)
+    return crud_app
+
+
+@pytest.fixture(scope="session")
+def _crud_session_client(crud_app):
+    """TestClient for crud_app, built once (not entered: nothing to start up)."""
+    from fastapi.testclient import TestClient
+
+    return TestClient(crud_app)
+
+
+@pytest.fixture
+def crud_client(_crud_session_client, db_connection):
+    """Lightweight client for pure-CRUD tests, backed by a rolled-back transaction."""
+    return _crud_session_client
 
 
 @pytest.fixture
@@ -63,6 +192,14 @@ def sample_artifact_data():
     }
 
 
+@pytest.fixture
+def seeded_model_artifact(db_session, sample_artifact_data):
+    """A model artifact inserted directly, skipping the HTTP create round-trip."""
+    from src.api.db import crud
+
+    return crud.create_artifact(db_session, "model", **sample_artifact_data)
+
+
 @pytest.fixture
 def sample_huggingface_url():
     """Sample HuggingFace URL for ingest testing."""
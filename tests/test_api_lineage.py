@@ -2,15 +2,37 @@
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+
+from src.api.db import crud
+from src.api.db.models import LineageEdge
+
+
+class _count_selects:
+    """Context manager counting SELECT statements issued on an engine."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "after_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "after_cursor_execute", self._on_execute)
 
 
 class TestLineage:
     """Test lineage functionality."""
 
-    def test_get_lineage_empty(self, client: TestClient, sample_artifact_data):
+    def test_get_lineage_empty(self, client: TestClient, seeded_model_artifact):
         """Test getting lineage for artifact with no relationships."""
-        create_response = client.post("/artifacts/model", json=sample_artifact_data)
-        artifact_id = create_response.json()["id"]
+        artifact_id = seeded_model_artifact.id
 
         response = client.get(f"/artifacts/model/{artifact_id}/lineage")
         assert response.status_code == 200
@@ -20,7 +42,7 @@ class TestLineage:
         assert data["parents"] == []
         assert data["children"] == []
 
-    def test_add_lineage_edge(self, client: TestClient):
+    def test_add_lineage_edge(self, client: TestClient, db_engine):
         """Test adding a lineage relationship."""
         # Create parent and child
         parent = client.post("/artifacts/model", json={"name": "parent", "url": "https://a.com/p"}).json()
@@ -31,8 +53,10 @@ class TestLineage:
         assert response.status_code == 200
         assert response.json()["success"] is True
 
-        # Verify lineage
-        lineage = client.get(f"/artifacts/model/{child['id']}/lineage").json()
+        # Verify lineage (artifact lookup + one parents/children query)
+        with _count_selects(db_engine) as selects:
+            lineage = client.get(f"/artifacts/model/{child['id']}/lineage").json()
+        assert selects.count <= 2
         assert len(lineage["parents"]) == 1
         assert lineage["parents"][0]["id"] == parent["id"]
 
@@ -57,10 +81,9 @@ class TestLineage:
 class TestCost:
     """Test cost calculation."""
 
-    def test_get_cost_no_dependencies(self, client: TestClient, sample_artifact_data):
+    def test_get_cost_no_dependencies(self, client: TestClient, seeded_model_artifact):
         """Test cost for artifact with no dependencies."""
-        create_response = client.post("/artifacts/model", json=sample_artifact_data)
-        artifact_id = create_response.json()["id"]
+        artifact_id = seeded_model_artifact.id
 
         response = client.get(f"/artifacts/model/{artifact_id}/cost")
         assert response.status_code == 200
@@ -71,36 +94,28 @@ class TestCost:
         assert data["dependencies_size_bytes"] == 0
         assert data["total_size_bytes"] == 0
 
-    def test_get_cost_with_dependencies(self, client: TestClient):
+    def test_get_cost_with_dependencies(self, client: TestClient, db_session, db_engine):
         """Test cost including dependencies."""
-        # Create parent artifact via API
-        parent_response = client.post("/artifacts/model", json={
-            "name": "parent-model",
-            "url": "https://huggingface.co/test/parent"
-        })
-        parent_id = parent_response.json()["id"]
-
-        # Create child artifact via API
-        child_response = client.post("/artifacts/model", json={
-            "name": "child-model",
-            "url": "https://huggingface.co/test/child"
-        })
-        child_id = child_response.json()["id"]
-
-        # Add lineage edge
-        client.post(f"/artifacts/model/{child_id}/lineage", json={
-            "parent_id": parent_id
-        })
-
-        # Get cost - should work now
-        response = client.get(f"/artifacts/model/{child_id}/cost")
+        # Insert parent, child, and the edge directly (ids generated client-side)
+        parent_id, child_id = crud.bulk_create_artifacts(db_session, [
+            {"type": "model", "name": "parent-model",
+             "url": "https://huggingface.co/test/parent", "size_bytes": 1000},
+            {"type": "model", "name": "child-model",
+             "url": "https://huggingface.co/test/child", "size_bytes": 500},
+        ])
+        db_session.execute(insert(LineageEdge), [{"parent_id": parent_id, "child_id": child_id}])
+        db_session.flush()
+
+        # Artifact lookup + one aggregate over the recursive dependency query
+        with _count_selects(db_engine) as selects:
+            response = client.get(f"/artifacts/model/{child_id}/cost")
         assert response.status_code == 200
+        assert selects.count <= 2
 
         data = response.json()
-        # Size will be 0 since we didn't set it, but structure should be correct
-        assert "own_size_bytes" in data
-        assert "dependencies_size_bytes" in data
-        assert "total_size_bytes" in data
+        assert data["own_size_bytes"] == 500
+        assert data["dependencies_size_bytes"] == 1000
+        assert data["total_size_bytes"] == 1500
 
     def test_cost_nonexistent_artifact(self, client: TestClient):
         """Test cost for non-existent artifact."""
@@ -119,12 +134,10 @@ class TestLicenseCheck:
         })
         assert response.status_code == 404
 
-    def test_license_check_artifact_no_license(self, client: TestClient, sample_artifact_data):
+    def test_license_check_artifact_no_license(self, client: TestClient, seeded_model_artifact):
         """Test license check when artifact has no license."""
-        artifact = client.post("/artifacts/model", json=sample_artifact_data).json()
-
         response = client.post("/license-check", json={
-            "artifact_id": artifact["id"],
+            "artifact_id": seeded_model_artifact.id,
             "github_url": "https://github.com/owner/repo"
         })
         assert response.status_code == 200
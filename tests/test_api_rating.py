@@ -4,51 +4,57 @@ import pytest
 from unittest.mock import patch, MagicMock
 from fastapi.testclient import TestClient
 
+from src.api.db import crud
+from src.api.routes import rating as rating_routes
+
+
+# Stubbed compute_all_metrics result for the rating endpoint tests
+_COMPUTED = {
+    "metrics": {
+        "net_score": 0.75,
+        "ramp_up_time": 0.8,
+        "bus_factor": 0.7,
+        "license": 1.0,
+        "performance_claims": 0.6,
+        "dataset_and_code_score": 0.5,
+        "dataset_quality": 0.5,
+        "code_quality": 0.6,
+        "size_score": {"raspberry_pi": 0.5, "jetson_nano": 0.5, "desktop_pc": 0.8, "aws_server": 1.0},
+        "reproducibility": 0.7,
+        "reviewedness": 0.5,
+        "treescore": 0.6,
+    },
+    "latencies": {
+        "net_score": 100,
+        "ramp_up_time": 50,
+        "bus_factor": 60,
+        "license": 30,
+        "performance_claims": 40,
+        "dataset_and_code_score": 80,
+        "dataset_quality": 70,
+        "code_quality": 90,
+    },
+}
+
 
 class TestRating:
     """Test rating functionality."""
 
-    @patch('src.api.routes.rating.compute_all_metrics')
-    def test_rate_artifact(self, mock_compute, client: TestClient, sample_artifact_data):
-        """Test rating an artifact."""
-        # Mock compute_all_metrics response
-        mock_compute.return_value = {
-            "metrics": {
-                "net_score": 0.75,
-                "ramp_up_time": 0.8,
-                "bus_factor": 0.7,
-                "license": 1.0,
-                "performance_claims": 0.6,
-                "dataset_and_code_score": 0.5,
-                "dataset_quality": 0.5,
-                "code_quality": 0.6,
-                "size_score": {"raspberry_pi": 0.5, "jetson_nano": 0.5, "desktop_pc": 0.8, "aws_server": 1.0},
-                "reproducibility": 0.7,
-                "reviewedness": 0.5,
-                "treescore": 0.6,
-            },
-            "latencies": {
-                "net_score": 100,
-                "ramp_up_time": 50,
-                "bus_factor": 60,
-                "license": 30,
-                "performance_claims": 40,
-                "dataset_and_code_score": 80,
-                "dataset_quality": 70,
-                "code_quality": 90,
-            },
-        }
+    @pytest.fixture(autouse=True)
+    def _stub_compute(self, monkeypatch):
+        """Skip real metric computation (network-bound) in the endpoint tests."""
+        monkeypatch.setattr(rating_routes, "compute_all_metrics", lambda url, **kwargs: _COMPUTED)
 
-        # Create artifact
-        create_response = client.post("/artifacts/model", json=sample_artifact_data)
-        artifact = create_response.json()
+    def test_rate_artifact(self, client: TestClient, seeded_model_artifact):
+        """Test rating an artifact."""
+        artifact_id = seeded_model_artifact.id
 
         # Rate artifact
-        response = client.post(f"/artifacts/model/{artifact['id']}/rating")
+        response = client.post(f"/artifacts/model/{artifact_id}/rating")
         assert response.status_code == 200
 
         data = response.json()
-        assert data["artifact_id"] == artifact["id"]
+        assert data["artifact_id"] == artifact_id
         assert "net_score" in data
         assert "ramp_up_time" in data
         assert "bus_factor" in data
@@ -62,48 +68,41 @@ class TestRating:
         assert "net_score_latency" in data
         assert isinstance(data["net_score_latency"], (int, float))
 
-    @patch('src.api.routes.rating.compute_all_metrics')
-    def test_get_rating(self, mock_compute, client: TestClient, sample_artifact_data):
+    def test_get_rating(self, client: TestClient, seeded_model_artifact):
         """Test getting existing rating."""
-        mock_compute.return_value = {
-            "metrics": {
-                "net_score": 0.75,
-                "ramp_up_time": 0.8,
-                "bus_factor": 0.7,
-                "license": 1.0,
-                "performance_claims": 0.6,
-                "dataset_and_code_score": 0.5,
-                "dataset_quality": 0.5,
-                "code_quality": 0.6,
-                "size_score": {"raspberry_pi": 0.5, "jetson_nano": 0.5, "desktop_pc": 0.8, "aws_server": 1.0},
-                "reproducibility": 0.7,
-                "reviewedness": 0.5,
-                "treescore": 0.6,
-            },
-            "latencies": {
-                "net_score": 100, "ramp_up_time": 50, "bus_factor": 60, "license": 30,
-                "performance_claims": 40, "dataset_and_code_score": 80, "dataset_quality": 70, "code_quality": 90,
-            },
-        }
-
-        # Create and rate artifact
-        create_response = client.post("/artifacts/model", json=sample_artifact_data)
-        artifact = create_response.json()
-        client.post(f"/artifacts/model/{artifact['id']}/rating")
+        artifact_id = seeded_model_artifact.id
+        client.post(f"/artifacts/model/{artifact_id}/rating")
 
         # Get rating
-        response = client.get(f"/artifacts/model/{artifact['id']}/rating")
+        response = client.get(f"/artifacts/model/{artifact_id}/rating")
         assert response.status_code == 200
-        assert response.json()["artifact_id"] == artifact["id"]
+        assert response.json()["artifact_id"] == artifact_id
 
-    def test_get_rating_not_rated(self, client: TestClient, sample_artifact_data):
+    def test_get_rating_not_rated(self, client: TestClient, seeded_model_artifact):
         """Test getting rating for unrated artifact."""
-        create_response = client.post("/artifacts/model", json=sample_artifact_data)
-        artifact = create_response.json()
-
-        response = client.get(f"/artifacts/model/{artifact['id']}/rating")
+        response = client.get(f"/artifacts/model/{seeded_model_artifact.id}/rating")
         assert response.status_code == 404
 
+    def test_spec_rating_sub_millisecond_latency(self, client: TestClient, db_session, seeded_model_artifact):
+        """Test latencies under 0.5 ms are reported as 0.001, not rounded to 0."""
+        metrics = dict(_COMPUTED["metrics"])
+        crud.create_rating(
+            db_session,
+            seeded_model_artifact.id,
+            license_score=metrics.pop("license"),
+            latencies={"net_score": 3e-5, "tree_score": 3e-5, "license": 0.0},
+            **metrics,
+        )
+
+        response = client.get(f"/artifact/model/{seeded_model_artifact.id}/rate")
+        assert response.status_code == 200
+
+        data = response.json()
+        latencies = {key: value for key, value in data.items() if key.endswith("_latency")}
+        assert latencies["net_score_latency"] == 0.001
+        assert latencies["tree_score_latency"] == 0.001
+        assert min(latencies.values()) > 0
+
     def test_rate_nonexistent_artifact(self, client: TestClient):
         """Test rating non-existent artifact."""
         response = client.post("/artifacts/model/nonexistent-id/rating")
@@ -163,6 +162,25 @@ class TestMetricsComputation:
         score = compute_net_score(metrics)
         assert 0.4 <= score <= 0.6  # Should be around 0.5
 
+    def test_scores_rounded_on_serialization(self):
+        """Test full-precision scores are rounded only in the JSON response."""
+        from src.api.models.schemas import ModelRating, SizeScore
+
+        floats = {
+            name: 2 / 3
+            for name, field in ModelRating.model_fields.items()
+            if field.annotation is float
+        }
+        rating = ModelRating(
+            name="m", category="MODEL", size_score=SizeScore(raspberry_pi=1 / 3), **floats
+        )
+
+        assert rating.net_score == 2 / 3
+        data = rating.model_dump(mode="json")
+        assert data["net_score"] == 0.667
+        assert data["tree_score_latency"] == 0.667
+        assert data["size_score"]["raspberry_pi"] == 0.333
+
     def test_quality_threshold(self):
         """Test quality threshold checking."""
         from src.api.services.metrics import passes_quality_threshold
@@ -199,3 +217,226 @@ class TestMetricsComputation:
         bad_metrics = {"net_score": 0.05}
         assert passes_quality_threshold(bad_metrics) is False
 
+    def test_compute_all_metrics_uses_cache(self, tmp_path, monkeypatch):
+        """Test metrics are reused when the model revision is unchanged."""
+        diskcache = pytest.importorskip("diskcache")
+        from src.api.services import metrics as metrics_service
+
+        monkeypatch.setattr(metrics_service, "_metrics_cache", diskcache.Cache(str(tmp_path)))
+        hf_data = {"sha": "abc123", "siblings": [], "downloads": 0, "likes": 0}
+
+        phase1_result = {"bus_factor": 0.9, "bus_factor_latency": 2500}
+
+        with patch.object(metrics_service, "_fetch_hf_data_for_phase2", return_value=hf_data), \
+             patch.object(metrics_service, "phase1_compute_one", return_value=phase1_result) as mock_phase1, \
+             patch.object(metrics_service, "compute_reviewedness", return_value=-1.0):
+            first = metrics_service.compute_all_metrics("https://huggingface.co/org/cached")
+            second = metrics_service.compute_all_metrics("https://huggingface.co/org/cached")
+
+        assert mock_phase1.call_count == 1
+        assert second["metrics"]["net_score"] == first["metrics"]["net_score"]
+        assert second["metrics"]["treescore"] == 0.0
+        # A hit reports no compute time, not the stored timings
+        assert first["latencies"]["bus_factor"] == 2.5
+        assert second["latencies"]["bus_factor"] == 0.0
+
+    def test_compute_all_metrics_fallback_not_cached(self, tmp_path, monkeypatch):
+        """Test placeholder metrics from the fallback path are recomputed next time."""
+        diskcache = pytest.importorskip("diskcache")
+        from src.api.services import metrics as metrics_service
+
+        cache = diskcache.Cache(str(tmp_path))
+        monkeypatch.setattr(metrics_service, "_metrics_cache", cache)
+        hf_data = {"sha": "abc123", "siblings": [], "downloads": 0, "likes": 0}
+
+        with patch.object(metrics_service, "_fetch_hf_data_for_phase2", return_value=hf_data), \
+             patch.object(metrics_service, "phase1_compute_one", return_value={}) as mock_phase1, \
+             patch.object(metrics_service, "compute_reviewedness", return_value=-1.0):
+            metrics_service.compute_all_metrics("https://huggingface.co/org/fallback")
+            metrics_service.compute_all_metrics("https://huggingface.co/org/fallback")
+
+        assert mock_phase1.call_count == 2
+        assert len(cache) == 0
+
+    def test_compute_all_metrics_read_only_cache(self, tmp_path, monkeypatch):
+        """Test read_only cache mode serves hits but never stores results."""
+        diskcache = pytest.importorskip("diskcache")
+        from src.api.services import metrics as metrics_service
+
+        cache = diskcache.Cache(str(tmp_path))
+        monkeypatch.setattr(metrics_service, "_metrics_cache", cache)
+        monkeypatch.setattr(metrics_service, "METRICS_CACHE_MODE", "read_only")
+        hf_data = {"sha": "abc123", "siblings": [], "downloads": 0, "likes": 0}
+        url = "https://huggingface.co/org/readonly"
+
+        with patch.object(metrics_service, "_fetch_hf_data_for_phase2", return_value=hf_data), \
+             patch.object(metrics_service, "phase1_compute_one", return_value={"bus_factor": 0.9}) as mock_phase1, \
+             patch.object(metrics_service, "compute_reviewedness", return_value=-1.0):
+            metrics_service.compute_all_metrics(url)
+            assert len(cache) == 0
+
+            key = metrics_service._metrics_cache_key(url, hf_data)
+            assert key.startswith(f"v{metrics_service.METRICS_VERSION}:")
+            cache.set(key, {"metrics": {"net_score": 0.42}, "latencies": {}})
+            result = metrics_service.compute_all_metrics(url)
+
+        assert mock_phase1.call_count == 1
+        assert result["metrics"]["net_score"] == 0.42
+
+        # Reviewedness lookups are read-only too
+        cache.clear()
+        github_data = {"cardData": {"github": "https://github.com/org/readonly"}}
+        with patch("src.api.services.github.compute_reviewedness_for_repo", return_value=0.75) as mock_repo:
+            assert metrics_service.compute_reviewedness(github_data) == 0.75
+            assert len(cache) == 0
+
+            cache.set(f"v{metrics_service.METRICS_VERSION}:reviewedness:https://github.com/org/readonly", 0.5)
+            assert metrics_service.compute_reviewedness(github_data) == 0.5
+
+        assert mock_repo.call_count == 1
+
+    def test_reviewedness_cached_per_repo(self, tmp_path, monkeypatch):
+        """Test GitHub reviewedness is looked up once per repo."""
+        diskcache = pytest.importorskip("diskcache")
+        from src.api.services import metrics as metrics_service
+
+        monkeypatch.setattr(metrics_service, "_metrics_cache", diskcache.Cache(str(tmp_path)))
+        hf_data = {"cardData": {"github": "https://github.com/org/repo"}}
+
+        with patch("src.api.services.github.compute_reviewedness_for_repo", return_value=0.75) as mock_repo:
+            assert metrics_service.compute_reviewedness(hf_data) == 0.75
+            assert metrics_service.compute_reviewedness(hf_data) == 0.75
+
+        assert mock_repo.call_count == 1
+
+    def test_reviewedness_failure_not_cached(self, tmp_path, monkeypatch):
+        """Test a -1 reviewedness (e.g. rate limited) is recomputed next time."""
+        diskcache = pytest.importorskip("diskcache")
+        from src.api.services import metrics as metrics_service
+
+        cache = diskcache.Cache(str(tmp_path))
+        monkeypatch.setattr(metrics_service, "_metrics_cache", cache)
+        hf_data = {"cardData": {"github": "https://github.com/org/throttled"}}
+
+        with patch("src.api.services.github.compute_reviewedness_for_repo", side_effect=[-1.0, 0.75]) as mock_repo:
+            assert metrics_service.compute_reviewedness(hf_data) == -1.0
+            assert len(cache) == 0
+            assert metrics_service.compute_reviewedness(hf_data) == 0.75
+
+        assert mock_repo.call_count == 2
+
+    def test_reproducibility_from_sibling_scan(self):
+        """Test reproducibility matches with and without a precomputed scan."""
+        from src.api.services.metrics import _scan_siblings, compute_reproducibility
+
+        hf_data = {
+            "siblings": [
+                {"rfilename": "config.json"},
+                {"rfilename": "tokenizer_config.json"},
+                {"rfilename": "model.safetensors"},
+            ],
+            "cardData": {"training_data": "wikipedia"},
+        }
+        names, _ = _scan_siblings(hf_data["siblings"])
+
+        assert compute_reproducibility(hf_data) == 1.0
+        assert compute_reproducibility(hf_data, filenames=names) == 1.0
+        assert compute_reproducibility({"siblings": []}) == 0.0
+
+    def test_reproducibility_from_safetensors_header(self):
+        """Test safetensors header metadata raises reproducibility."""
+        import struct
+        from src.api.services import metrics as metrics_service
+
+        header = (
+            b'{"__metadata__": {"format": "pt"},'
+            b' "w": {"dtype": "F16", "shape": [2], "data_offsets": [0, 4]}}'
+        )
+        length = MagicMock(status_code=206, content=struct.pack("<Q", len(header)))
+        body = MagicMock(status_code=206, content=header)
+        session = MagicMock()
+        session.get.side_effect = [length, body]
+
+        with patch.object(metrics_service, "get_hf_session", return_value=session):
+            parsed = metrics_service._fetch_safetensors_header("org/model")
+
+        second_headers = session.get.call_args_list[1].kwargs["headers"]
+        assert second_headers["Range"] == f"bytes=8-{7 + len(header)}"
+        hf_data = {"siblings": [{"rfilename": "config.json"}]}
+        assert metrics_service.compute_reproducibility(hf_data) == 0.5
+        assert metrics_service.compute_reproducibility(hf_data, safetensors_header=parsed) == 1.0
+
+    def test_extract_github_urls_dedupes_in_order(self):
+        """Test GitHub URL extraction canonicalizes variants and keeps order."""
+        from src.api.services.metrics import _extract_github_urls, _normalize_hf_data
+
+        hf_data = {
+            "cardData": {"repo_url": "https://github.com/org/first/"},
+            "tags": ["https://github.com/org/second.git"],
+            "readme": (
+                "See https://github.com/org/first and https://github.com/org/second "
+                "or https://github.com/org/third and https://github.com/org/fourth"
+            ),
+        }
+
+        assert _extract_github_urls(_normalize_hf_data(hf_data)) == [
+            "https://github.com/org/first",
+            "https://github.com/org/second",
+            "https://github.com/org/third",
+        ]
+
+    def test_readme_scan_collects_github_and_dataset_links(self):
+        """Test one pass over the card text yields both link kinds."""
+        from src.api.services.metrics import (
+            _extract_dataset_urls,
+            _extract_github_urls,
+            _normalize_hf_data,
+        )
+
+        hf = _normalize_hf_data({
+            "datasets": ["squad"],
+            "card": (
+                "Code: https://github.com/org/repo. "
+                "Trained on https://huggingface.co/datasets/org/corpus."
+            ),
+        })
+
+        assert _extract_github_urls(hf) == ["https://github.com/org/repo"]
+        assert _extract_dataset_urls(hf) == [
+            "https://huggingface.co/datasets/squad",
+            "https://huggingface.co/datasets/org/corpus",
+        ]
+
+    def test_extract_dataset_urls_limits_unique(self):
+        """Test dataset URL extraction stops at five unique URLs."""
+        from src.api.services.metrics import _extract_dataset_urls, _normalize_hf_data
+
+        hf_data = {
+            "dataset_tags": ["squad", "squad", "https://example.com/ds/"],
+            "cardData": {"datasets": [f"ds{i}" for i in range(100)]},
+        }
+
+        assert _extract_dataset_urls(_normalize_hf_data(hf_data)) == [
+            "https://huggingface.co/datasets/squad",
+            "https://example.com/ds",
+            "https://huggingface.co/datasets/ds0",
+            "https://huggingface.co/datasets/ds1",
+            "https://huggingface.co/datasets/ds2",
+        ]
+
+    def test_fetch_hf_data_reuses_cached_response(self):
+        """Test repeated HF metadata fetches within the TTL hit the API once."""
+        from src.api.services import metrics as metrics_service
+
+        response = MagicMock(status_code=200, content=b'{"id": "org/model", "likes": 5}')
+        session = MagicMock()
+        session.get.return_value = response
+
+        metrics_service._fetch_hf_data_cached.cache_clear()
+        with patch.object(metrics_service, "get_hf_session", return_value=session):
+            first = metrics_service._fetch_hf_data_for_phase2("https://huggingface.co/org/model")
+            second = metrics_service._fetch_hf_data_for_phase2("https://huggingface.co/org/model")
+        metrics_service._fetch_hf_data_cached.cache_clear()
+
+        assert first == second == {"id": "org/model", "likes": 5}
+        assert session.get.call_count == 1
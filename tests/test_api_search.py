@@ -3,16 +3,20 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from src.api.db import crud
+
 
 class TestSearch:
     """Test search functionality."""
 
-    def test_search_by_name(self, client: TestClient):
+    def test_search_by_name(self, client: TestClient, db_session):
         """Test searching artifacts by name."""
         # Create artifacts with different names
-        client.post("/artifacts/model", json={"name": "bert-base", "url": "https://a.com/1"})
-        client.post("/artifacts/model", json={"name": "gpt2-small", "url": "https://a.com/2"})
-        client.post("/artifacts/model", json={"name": "bert-large", "url": "https://a.com/3"})
+        crud.bulk_create_artifacts(db_session, [
+            {"type": "model", "name": "bert-base", "url": "https://a.com/1"},
+            {"type": "model", "name": "gpt2-small", "url": "https://a.com/2"},
+            {"type": "model", "name": "bert-large", "url": "https://a.com/3"},
+        ])
 
         # Search for "bert"
         response = client.get("/artifacts/search?query=bert")
@@ -23,11 +27,13 @@ class TestSearch:
         assert len(data["results"]) == 2
         assert all("bert" in r["name"].lower() for r in data["results"])
 
-    def test_search_regex_pattern(self, client: TestClient):
+    def test_search_regex_pattern(self, client: TestClient, db_session):
         """Test search with regex pattern."""
-        client.post("/artifacts/model", json={"name": "model-v1", "url": "https://a.com/1"})
-        client.post("/artifacts/model", json={"name": "model-v2", "url": "https://a.com/2"})
-        client.post("/artifacts/model", json={"name": "dataset-v1", "url": "https://a.com/3"})
+        crud.bulk_create_artifacts(db_session, [
+            {"type": "model", "name": "model-v1", "url": "https://a.com/1"},
+            {"type": "model", "name": "model-v2", "url": "https://a.com/2"},
+            {"type": "model", "name": "dataset-v1", "url": "https://a.com/3"},
+        ])
 
         # Search with regex
         response = client.get("/artifacts/search?query=model-v[12]")
@@ -36,17 +42,21 @@ class TestSearch:
         data = response.json()
         assert len(data["results"]) == 2
 
-    def test_search_case_insensitive(self, client: TestClient):
+    def test_search_case_insensitive(self, client: TestClient, db_session):
         """Test search is case insensitive."""
-        client.post("/artifacts/model", json={"name": "BERT-Base", "url": "https://a.com/1"})
+        crud.bulk_create_artifacts(db_session, [
+            {"type": "model", "name": "BERT-Base", "url": "https://a.com/1"},
+        ])
 
         response = client.get("/artifacts/search?query=bert")
         assert response.status_code == 200
         assert len(response.json()["results"]) == 1
 
-    def test_search_no_results(self, client: TestClient):
+    def test_search_no_results(self, client: TestClient, db_session):
         """Test search with no matching results."""
-        client.post("/artifacts/model", json={"name": "test-model", "url": "https://a.com/1"})
+        crud.bulk_create_artifacts(db_session, [
+            {"type": "model", "name": "test-model", "url": "https://a.com/1"},
+        ])
 
         response = client.get("/artifacts/search?query=nonexistent")
         assert response.status_code == 200
@@ -60,10 +70,28 @@ class TestSearch:
         response = client.get("/artifacts/search?query=[invalid")
         assert response.status_code == 400
 
-    def test_search_with_type_filter(self, client: TestClient):
+    def test_search_unsafe_regex_rejected(self, client: TestClient):
+        """Test that ReDoS-prone patterns are rejected, including on repeat."""
+        for _ in range(2):
+            response = client.get("/artifacts/search?query=(a%2B)%2B")
+            assert response.status_code == 400
+            assert "malicious" in response.json()["detail"]
+
+    def test_search_regex_compiled_once(self):
+        """Test that repeated patterns reuse the cached compiled regex."""
+        from src.api.routes.search import _compile_search_regex
+
+        first = _compile_search_regex("cached-pattern-[0-9]")
+        hits = _compile_search_regex.cache_info().hits
+        assert _compile_search_regex("cached-pattern-[0-9]") is first
+        assert _compile_search_regex.cache_info().hits == hits + 1
+
+    def test_search_with_type_filter(self, client: TestClient, db_session):
         """Test search with artifact type filter."""
-        client.post("/artifacts/model", json={"name": "test-model", "url": "https://a.com/1"})
-        client.post("/artifacts/dataset", json={"name": "test-dataset", "url": "https://a.com/2"})
+        crud.bulk_create_artifacts(db_session, [
+            {"type": "model", "name": "test-model", "url": "https://a.com/1"},
+            {"type": "dataset", "name": "test-dataset", "url": "https://a.com/2"},
+        ])
 
         response = client.get("/artifacts/search?query=test&artifact_type=model")
         assert response.status_code == 200
@@ -72,11 +100,13 @@ class TestSearch:
         assert len(data["results"]) == 1
         assert data["results"][0]["type"] == "model"
 
-    def test_search_limit(self, client: TestClient):
+    def test_search_limit(self, client: TestClient, db_session):
         """Test search result limit returns correct total."""
-        # Create many artifacts
-        for i in range(10):
-            client.post("/artifacts/model", json={"name": f"model-{i}", "url": f"https://a.com/{i}"})
+        # Create many artifacts (one executemany INSERT)
+        crud.bulk_create_artifacts(db_session, [
+            {"type": "model", "name": f"model-{i}", "url": f"https://a.com/{i}"}
+            for i in range(10)
+        ])
 
         response = client.get("/artifacts/search?query=model&limit=5")
         assert response.status_code == 200
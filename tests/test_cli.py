@@ -1,76 +1,89 @@
 """Tests for CLI module.
 
-These tests use mocking to avoid real API calls, making them fast and reliable.
+These tests stub out metric computation to avoid real API calls, making them
+fast and reliable.
 """
 import json
 import pytest
-from unittest.mock import patch, MagicMock
+from src.core import compute
 from src.core.cli import main
 
+# Fast NDJSON line parsing (optional - stdlib fallback)
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
 
-# --- Valid Model URL (mocked) ---
-@patch('src.core.compute.compute_one')
-def test_cli_outputs_json_for_model(mock_compute, tmp_path, capsys):
+_ROW = {
+    "name": "test-model",
+    "category": "MODEL",
+    "net_score": 0.75,
+    "ramp_up_time": 0.8,
+    "bus_factor": 0.7,
+    "license": 1.0,
+}
+
+
+@pytest.fixture(autouse=True)
+def stub_compute(monkeypatch):
+    """Replace the network-bound compute_one with a canned MODEL row."""
+    monkeypatch.setattr(compute, "compute_one", lambda url, *args, **kwargs: _ROW)
+
+
+@pytest.fixture(scope="module")
+def urls_dir(tmp_path_factory):
+    """One scratch directory for all URL files in this module."""
+    return tmp_path_factory.mktemp("cli_urls")
+
+
+@pytest.fixture
+def run_cli(urls_dir, request, capsys):
+    """Run the CLI over the given URL file contents; returns (exit code, captured)."""
+    def _run(contents):
+        urls_file = urls_dir / f"{request.node.name}.txt"
+        urls_file.write_text(contents)
+        result = main(["cli", str(urls_file)])
+        return result, capsys.readouterr()
+    return _run
+
+
+# --- Valid Model URL ---
+def test_cli_outputs_json_for_model(run_cli):
     """Test CLI outputs valid JSON for a model URL."""
-    mock_compute.return_value = {
-        "name": "google/gemma-3-270m",
-        "category": "MODEL",
-        "net_score": 0.75,
-        "ramp_up_time": 0.8,
-        "bus_factor": 0.7,
-        "license": 1.0,
-    }
-    
-    urls_file = tmp_path / "urls.txt"
-    urls_file.write_text("https://huggingface.co/google/gemma-3-270m\n")
-    main(["cli", str(urls_file)])
-    captured = capsys.readouterr()
-    
+    _, captured = run_cli("https://huggingface.co/google/gemma-3-270m\n")
+
+    # write_rows binds sys.stdout at import, so output may bypass capsys
     if captured.out.strip():
-        obj = json.loads(captured.out.strip())
+        obj = _loads(captured.out.strip())
         assert obj["category"] == "MODEL"
-    else:
-        # If no output, the mock might not have been called correctly
-        # Just verify no crash occurred
-        pass
-
-
-# --- Skips Dataset ---
-def test_cli_skips_dataset(tmp_path, capsys):
-    """Test CLI skips dataset URLs."""
-    urls_file = tmp_path / "urls.txt"
-    urls_file.write_text("https://huggingface.co/datasets/xlangai/AgentNet\n")
-    main(["cli", str(urls_file)])
-    captured = capsys.readouterr()
-    # Datasets are skipped, so output should be empty or minimal
-    assert "error" not in captured.err.lower() or captured.out.strip() == ""
-
-
-# --- Multiple URLs (mocked) ---
-@patch('src.core.compute.compute_one')
-def test_cli_multiple_urls(mock_compute, tmp_path, capsys):
-    """Test CLI handles multiple URLs."""
-    mock_compute.return_value = {
-        "name": "test-model",
-        "category": "MODEL",
-        "net_score": 0.75,
-    }
-    
-    urls_file = tmp_path / "urls.txt"
-    urls_file.write_text(
-        "https://huggingface.co/google/gemma-3-270m\n"
-        "https://huggingface.co/datasets/xlangai/AgentNet\n"
-    )
-    main(["cli", str(urls_file)])
-    captured = capsys.readouterr()
-    # Should process without crashing
+
+
+# --- Inputs that must be handled without crashing ---
+@pytest.mark.parametrize("contents", [
+    # Dataset only (skipped)
+    "https://huggingface.co/datasets/xlangai/AgentNet\n",
+    # Model followed by a dataset
+    "https://huggingface.co/google/gemma-3-270m\n"
+    "https://huggingface.co/datasets/xlangai/AgentNet\n",
+    # Invalid URL
+    "not_a_real_url\n",
+    # Non-model (GitHub) URL
+    "https://github.com/SkyworkAI/Matrix-Game\n",
+    # Multiple models
+    "https://huggingface.co/google/model1\n"
+    "https://huggingface.co/google/model2\n",
+], ids=["dataset", "model-and-dataset", "invalid-url", "github-url", "multiple-models"])
+def test_cli_handles_input(run_cli, contents):
+    """Test CLI processes each kind of URL list without crashing."""
+    _, captured = run_cli(contents)
     assert "Traceback" not in captured.err
+    assert "error" not in captured.err.lower()
 
 
 # --- Invalid File ---
-def test_cli_missing_file(tmp_path, capsys):
+def test_cli_missing_file(urls_dir, capsys):
     """Test CLI handles missing file gracefully."""
-    bad_file = tmp_path / "does_not_exist.txt"
+    bad_file = urls_dir / "does_not_exist.txt"
     result = main(["cli", str(bad_file)])
     captured = capsys.readouterr()
     # Should return error code or print error message
@@ -78,74 +91,21 @@ def test_cli_missing_file(tmp_path, capsys):
 
 
 # --- Empty File ---
-def test_cli_empty_file(tmp_path, capsys):
+def test_cli_empty_file(run_cli):
     """Test CLI handles empty file."""
-    urls_file = tmp_path / "urls.txt"
-    urls_file.write_text("")
-    main(["cli", str(urls_file)])
-    captured = capsys.readouterr()
+    _, captured = run_cli("")
     assert captured.out.strip() == ""
 
 
-# --- Invalid URL ---
-def test_cli_invalid_url(tmp_path, capsys):
-    """Test CLI handles invalid URLs without crashing."""
-    urls_file = tmp_path / "urls.txt"
-    urls_file.write_text("not_a_real_url\n")
-    main(["cli", str(urls_file)])
-    captured = capsys.readouterr()
-    # Should not crash
-    assert "Traceback" not in captured.err
-
-
-# --- Non-Model URL ---
-def test_cli_non_model_url(tmp_path, capsys):
-    """Test CLI handles non-model URLs."""
-    urls_file = tmp_path / "urls.txt"
-    urls_file.write_text("https://github.com/SkyworkAI/Matrix-Game\n")
-    main(["cli", str(urls_file)])
-    captured = capsys.readouterr()
-    # Should not crash
-    assert "Traceback" not in captured.err
-
-
-# --- Multiple Models (mocked) ---
-@patch('src.core.compute.compute_one')
-def test_cli_multiple_models(mock_compute, tmp_path, capsys):
-    """Test CLI processes multiple models."""
-    mock_compute.return_value = {
-        "name": "test-model",
-        "category": "MODEL",
-        "net_score": 0.75,
-    }
-    
-    urls_file = tmp_path / "urls.txt"
-    urls_file.write_text(
+# --- NDJSON Validity ---
+def test_cli_ndjson_output(run_cli):
+    """Test CLI outputs valid NDJSON."""
+    _, captured = run_cli(
         "https://huggingface.co/google/model1\n"
         "https://huggingface.co/google/model2\n"
     )
-    main(["cli", str(urls_file)])
-    captured = capsys.readouterr()
-    # Should process without crashing
-    assert "Traceback" not in captured.err
 
-
-# --- NDJSON Validity (mocked) ---
-@patch('src.core.compute.compute_one')
-def test_cli_ndjson_output(mock_compute, tmp_path, capsys):
-    """Test CLI outputs valid NDJSON."""
-    mock_compute.return_value = {
-        "name": "test-model",
-        "category": "MODEL",
-        "net_score": 0.75,
-    }
-    
-    urls_file = tmp_path / "urls.txt"
-    urls_file.write_text("https://huggingface.co/google/gemma-3-270m\n")
-    main(["cli", str(urls_file)])
-    captured = capsys.readouterr()
-    
     # Each non-empty line should be valid JSON
-    for line in captured.out.strip().splitlines():
+    for line in captured.out.splitlines():
         if line.strip():
-            json.loads(line)  # must be valid JSON
+            _loads(line)  # must be valid JSON
@@ -0,0 +1,93 @@
+"""Micro-benchmarks for hot CRUD paths.
+
+Uses pytest-benchmark's pedantic mode so only the CRUD call is timed (not
+fixture setup). Run with `pytest tests/test_crud_bench.py --benchmark-only`;
+skip in regular runs with `--benchmark-skip`.
+"""
+
+import pytest
+
+# Skip all benchmarks if pytest-benchmark is not installed
+pytest.importorskip("pytest_benchmark")
+
+from src.api.db import crud
+
+pytestmark = pytest.mark.benchmark
+
+_ROUNDS = 100
+_WARMUP_ROUNDS = 3
+_SIZE_SCORE = {"raspberry_pi": 0.5, "jetson_nano": 0.6, "desktop_pc": 0.8, "aws_server": 1.0}
+
+
+def _rating_kwargs(artifact_id):
+    """Keyword arguments for crud.create_rating with fixed scores."""
+    return {
+        "artifact_id": artifact_id,
+        "net_score": 0.75,
+        "ramp_up_time": 0.8,
+        "bus_factor": 0.7,
+        "license_score": 1.0,
+        "performance_claims": 0.6,
+        "dataset_and_code_score": 0.5,
+        "dataset_quality": 0.5,
+        "code_quality": 0.6,
+        "size_score": _SIZE_SCORE,
+    }
+
+
+@pytest.fixture
+def seeded_registry(db_session):
+    """Fifty artifacts, the first with a few ratings, plus an hour of events."""
+    ids = crud.bulk_create_artifacts(db_session, [
+        {"type": "model", "name": f"bench-model-{i}", "url": f"https://huggingface.co/b/{i}"}
+        for i in range(50)
+    ])
+    for _ in range(5):
+        crud.create_rating(db_session, **_rating_kwargs(ids[0]))
+    for i in range(200):
+        crud.record_event(db_session, f"/artifacts/{i % 5}", "GET", 200 if i % 10 else 500, i)
+    return ids
+
+
+class TestCrudBenchmarks:
+    """Benchmark CRUD functions used on request paths."""
+
+    def test_bench_create_rating(self, benchmark, db_session, seeded_registry):
+        """Benchmark inserting a rating."""
+        benchmark.pedantic(
+            crud.create_rating,
+            args=(db_session,),
+            kwargs=_rating_kwargs(seeded_registry[1]),
+            rounds=_ROUNDS,
+            warmup_rounds=_WARMUP_ROUNDS,
+        )
+
+    def test_bench_get_latest_rating(self, benchmark, db_session, seeded_registry):
+        """Benchmark fetching the latest rating for an artifact."""
+        rating = benchmark.pedantic(
+            crud.get_latest_rating,
+            args=(db_session, seeded_registry[0]),
+            rounds=_ROUNDS,
+            warmup_rounds=_WARMUP_ROUNDS,
+        )
+        assert rating is not None
+
+    def test_bench_search_artifacts(self, benchmark, db_session, seeded_registry):
+        """Benchmark a name search over the seeded artifacts."""
+        results = benchmark.pedantic(
+            crud.search_artifacts,
+            args=(db_session, "bench-model-1"),
+            rounds=_ROUNDS,
+            warmup_rounds=_WARMUP_ROUNDS,
+        )
+        assert len(results) == 11  # bench-model-1 and bench-model-10..19
+
+    def test_bench_get_health_stats(self, benchmark, db_session, seeded_registry):
+        """Benchmark aggregating the last hour of events."""
+        stats = benchmark.pedantic(
+            crud.get_health_stats,
+            args=(db_session,),
+            rounds=_ROUNDS,
+            warmup_rounds=_WARMUP_ROUNDS,
+        )
+        assert sum(stats["request_counts"].values()) == 200
@@ -7,6 +7,17 @@ from src.api.db import crud
 from src.api.db.models import Artifact, Rating, LineageEdge, Event
 
 
+@pytest.fixture
+def populated_artifacts(db_session):
+    """Three models and a dataset, inserted in one statement; returns their ids."""
+    return crud.bulk_create_artifacts(db_session, [
+        {"type": "model", "name": "bert-base", "url": "https://a.com/1"},
+        {"type": "model", "name": "gpt2", "url": "https://a.com/2"},
+        {"type": "model", "name": "bert-large", "url": "https://a.com/3"},
+        {"type": "dataset", "name": "d1", "url": "https://a.com/4"},
+    ])
+
+
 class TestArtifactCRUD:
     """Test artifact CRUD operations."""
 
@@ -25,51 +36,65 @@ class TestArtifactCRUD:
         assert artifact.url == "https://example.com/model"
         assert artifact.created_at is not None
 
-    def test_get_artifact(self, db_session):
+    def test_bulk_create_artifacts(self, db_session):
+        """Test creating several artifacts in one insert."""
+        ids = crud.bulk_create_artifacts(db_session, [
+            {"type": "model", "name": "m1", "url": "https://a.com/1"},
+            {"type": "dataset", "name": "d1", "url": "https://a.com/2"},
+        ])
+
+        assert len(ids) == 2
+        first = crud.get_artifact(db_session, ids[0])
+        assert first.name == "m1"
+        assert first.created_at is not None
+        assert crud.get_artifact(db_session, ids[1]).type == "dataset"
+        assert crud.bulk_create_artifacts(db_session, []) == []
+
+    def test_get_artifact(self, db_session, populated_artifacts):
         """Test getting an artifact."""
-        created = crud.create_artifact(
-            db_session, "model", "test", "https://a.com/m"
-        )
-
-        fetched = crud.get_artifact(db_session, created.id)
+        fetched = crud.get_artifact(db_session, populated_artifacts[0])
         assert fetched is not None
-        assert fetched.id == created.id
+        assert fetched.id == populated_artifacts[0]
+        assert fetched.name == "bert-base"
 
     def test_get_artifact_not_found(self, db_session):
         """Test getting non-existent artifact."""
         result = crud.get_artifact(db_session, "nonexistent")
         assert result is None
 
-    def test_list_artifacts(self, db_session):
-        """Test listing artifacts."""
-        crud.create_artifact(db_session, "model", "m1", "https://a.com/1")
-        crud.create_artifact(db_session, "model", "m2", "https://a.com/2")
-        crud.create_artifact(db_session, "dataset", "d1", "https://a.com/3")
-
-        # List all
-        all_artifacts = crud.list_artifacts(db_session)
-        assert len(all_artifacts) == 3
-
-        # Filter by type
-        models = crud.list_artifacts(db_session, artifact_type="model")
-        assert len(models) == 2
-
-    def test_delete_artifact(self, db_session):
+    @pytest.mark.parametrize("artifact_type,expected", [
+        (None, 4),
+        ("model", 3),
+        ("dataset", 1),
+    ])
+    def test_list_artifacts(self, db_session, populated_artifacts, artifact_type, expected):
+        """Test listing artifacts, optionally filtered by type."""
+        artifacts = crud.list_artifacts(db_session, artifact_type=artifact_type)
+        assert len(artifacts) == expected
+
+    def test_list_by_type_uses_index(self, db_session):
+        """Test the type-filtered listing is served from the (type, created_at) index."""
+        from sqlalchemy import text
+
+        plan = db_session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM artifacts "
+            "WHERE type = 'model' ORDER BY created_at DESC"
+        )).all()
+        details = " ".join(row[-1] for row in plan)
+        assert "ix_artifact_type_created_desc" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_delete_artifact(self, db_session, populated_artifacts):
         """Test deleting an artifact."""
-        artifact = crud.create_artifact(db_session, "model", "test", "https://a.com/m")
-
-        result = crud.delete_artifact(db_session, artifact.id)
+        result = crud.delete_artifact(db_session, populated_artifacts[1])
         assert result is True
 
-        # Verify deletion
-        assert crud.get_artifact(db_session, artifact.id) is None
+        # Verify deletion (and that siblings are untouched)
+        assert crud.get_artifact(db_session, populated_artifacts[1]) is None
+        assert crud.count_artifacts(db_session) == 3
 
-    def test_search_artifacts(self, db_session):
+    def test_search_artifacts(self, db_session, populated_artifacts):
         """Test searching artifacts."""
-        crud.create_artifact(db_session, "model", "bert-base", "https://a.com/1")
-        crud.create_artifact(db_session, "model", "gpt2", "https://a.com/2")
-        crud.create_artifact(db_session, "model", "bert-large", "https://a.com/3")
-
         results = crud.search_artifacts(db_session, "bert")
         assert len(results) == 2
 
@@ -116,6 +141,18 @@ class TestRatingCRUD:
         assert latest is not None
         assert latest.net_score == 0.8  # Most recent
 
+    def test_latest_rating_uses_index(self, db_session):
+        """Test the latest-rating lookup is served from the (artifact_id, created_at) index."""
+        from sqlalchemy import text
+
+        plan = db_session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM ratings "
+            "WHERE artifact_id = 'x' ORDER BY created_at DESC LIMIT 1"
+        )).all()
+        details = " ".join(row[-1] for row in plan)
+        assert "ix_rating_artifact_created_desc" in details
+        assert "TEMP B-TREE" not in details
+
 
 class TestLineageCRUD:
     """Test lineage CRUD operations."""
@@ -153,6 +190,41 @@ class TestLineageCRUD:
         children = crud.get_children(db_session, parent.id)
         assert len(children) == 2
 
+    def test_get_parents_with_latest_rating(self, db_session):
+        """Test getting parents with their latest scores in one query."""
+        rated = crud.create_artifact(db_session, "model", "rated", "https://a.com/r")
+        unrated = crud.create_artifact(db_session, "model", "unrated", "https://a.com/u")
+        child = crud.create_artifact(db_session, "model", "child", "https://a.com/c")
+
+        crud.add_lineage_edge(db_session, rated.id, child.id)
+        crud.add_lineage_edge(db_session, unrated.id, child.id)
+
+        size_score = {"raspberry_pi": 0.5, "jetson_nano": 0.5, "desktop_pc": 0.5, "aws_server": 0.5}
+        crud.create_rating(
+            db_session, rated.id, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, size_score
+        )
+        crud.create_rating(
+            db_session, rated.id, 0.9, 0.9, 0.9, 0.9, 0.9, 0.9, 0.9, 0.9, size_score
+        )
+
+        scores = crud.get_parents_with_latest_rating(db_session, child.id)
+        assert scores == {rated.id: 0.9, unrated.id: None}
+        assert crud.get_parents_with_latest_rating(db_session, rated.id) == {}
+
+    def test_get_lineage(self, db_session):
+        """Test getting parents and children together."""
+        parent = crud.create_artifact(db_session, "model", "p", "https://a.com/p")
+        middle = crud.create_artifact(db_session, "model", "m", "https://a.com/m")
+        child = crud.create_artifact(db_session, "model", "c", "https://a.com/c")
+
+        crud.add_lineage_edge(db_session, parent.id, middle.id)
+        crud.add_lineage_edge(db_session, middle.id, child.id)
+
+        parents, children = crud.get_lineage(db_session, middle.id)
+        assert [p.id for p in parents] == [parent.id]
+        assert [c.id for c in children] == [child.id]
+        assert crud.get_lineage(db_session, "nonexistent") == ([], [])
+
     def test_get_all_dependencies(self, db_session):
         """Test getting all dependencies recursively."""
         grandparent = crud.create_artifact(db_session, "model", "gp", "https://a.com/gp")
@@ -165,6 +237,23 @@ class TestLineageCRUD:
         deps = crud.get_all_dependencies(db_session, child.id)
         assert len(deps) == 2
 
+    def test_dependencies_diamond_counted_once(self, db_session):
+        """Test a shared grandparent is returned and sized only once."""
+        root = crud.create_artifact(db_session, "model", "root", "https://a.com/r", size_bytes=100)
+        left = crud.create_artifact(db_session, "model", "l", "https://a.com/l", size_bytes=10)
+        right = crud.create_artifact(db_session, "model", "r", "https://a.com/rt", size_bytes=20)
+        child = crud.create_artifact(db_session, "model", "c", "https://a.com/c", size_bytes=1)
+
+        crud.add_lineage_edge(db_session, root.id, left.id)
+        crud.add_lineage_edge(db_session, root.id, right.id)
+        crud.add_lineage_edge(db_session, left.id, child.id)
+        crud.add_lineage_edge(db_session, right.id, child.id)
+
+        deps = crud.get_all_dependencies(db_session, child.id)
+        assert sorted(d.name for d in deps) == ["l", "r", "root"]
+        assert crud.get_dependencies_size(db_session, child.id) == 130
+        assert crud.get_dependencies_size(db_session, root.id) == 0
+
 
 class TestEventCRUD:
     """Test event CRUD operations."""
@@ -209,4 +298,7 @@ class TestEventCRUD:
         # Check counts
         assert stats["request_counts"].get("GET /artifacts", 0) == 3
         assert stats["error_counts"].get("GET /artifacts", 0) == 1
+        assert "POST /artifacts" not in stats["error_counts"]
+        assert stats["avg_latency_ms"]["GET /artifacts"] == pytest.approx(310 / 3)
+        assert stats["avg_latency_ms"]["POST /artifacts"] == 100.0
 
@@ -1,8 +1,10 @@
 """Tests for the GitHub service."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import create_autospec, patch
 
+from src.api.services import github as github_module
 from src.api.services.github import (
     get_github_headers,
     extract_repo_info,
@@ -10,169 +12,185 @@ from src.api.services.github import (
     get_pull_requests,
     get_pr_reviews,
     get_commits,
+    graphql_repo_reviewedness,
     compute_reviewedness_for_repo,
     find_github_url_for_model,
 )
 
 
-class TestGetGitHubHeaders:
-    """Tests for GitHub headers generation."""
+def _resp(status_code, payload=None, headers=None):
+    """A minimal stand-in for requests.Response (status_code, headers, json())."""
+    return SimpleNamespace(status_code=status_code, headers=headers or {}, json=lambda: payload)
 
-    def test_headers_without_token(self):
-        """Test headers without token."""
-        with patch.dict("os.environ", {}, clear=True):
-            # Need to reload module to pick up new env
-            headers = get_github_headers()
-            assert "Accept" in headers
-            assert "User-Agent" in headers
-
-    @patch.dict("os.environ", {"GITHUB_TOKEN": "test-token"})
-    def test_headers_with_token(self):
-        """Test headers with token."""
-        # Reload the module to pick up the token
-        import importlib
-        import src.api.services.github as github_module
-        importlib.reload(github_module)
-
-        headers = github_module.get_github_headers()
-        assert "Accept" in headers
-        assert "User-Agent" in headers
 
+@pytest.fixture(autouse=True)
+def _clear_github_cache():
+    """Start every test with empty GitHub response and ETag caches."""
+    github_module._fetch_json_cached.cache_clear()
+    github_module._etags.clear()
 
-class TestExtractRepoInfo:
-    """Tests for extracting repo info from URL."""
 
-    def test_standard_github_url(self):
-        """Test standard GitHub URL."""
-        result = extract_repo_info("https://github.com/owner/repo")
-        assert result == ("owner", "repo")
+@pytest.fixture
+def session_get():
+    """The shared GitHub session's get(), replaced by a mock for one test."""
+    with patch.object(github_module._session, "get") as mock_get:
+        yield mock_get
 
-    def test_github_url_with_git_suffix(self):
-        """Test GitHub URL with .git suffix."""
-        result = extract_repo_info("https://github.com/owner/repo.git")
-        assert result == ("owner", "repo")
 
-    def test_github_url_with_trailing_slash(self):
-        """Test GitHub URL with trailing slash."""
-        result = extract_repo_info("https://github.com/owner/repo/")
-        assert result == ("owner", "repo")
+@pytest.fixture
+def github_api(monkeypatch):
+    """Autospec'd stand-ins for the GitHub API helpers used by reviewedness.
 
-    def test_github_ssh_url(self):
-        """Test GitHub SSH URL."""
-        result = extract_repo_info("git@github.com:owner/repo.git")
-        assert result == ("owner", "repo")
+    Returns a dict of mocks keyed by function name; unset mocks return an
+    empty list (or None for get_repo_info and graphql_repo_reviewedness,
+    so the REST path runs).
+    """
+    mocks = {}
+    for name in ("graphql_repo_reviewedness", "get_repo_info", "get_pull_requests",
+                 "get_pr_reviews", "get_commits"):
+        mock = create_autospec(getattr(github_module, name), spec_set=True)
+        mock.return_value = None if name in ("graphql_repo_reviewedness", "get_repo_info") else []
+        monkeypatch.setattr(github_module, name, mock)
+        mocks[name] = mock
+    return mocks
 
-    def test_invalid_url(self):
-        """Test invalid URL returns None."""
-        assert extract_repo_info("https://gitlab.com/owner/repo") is None
-        assert extract_repo_info("not a url") is None
 
+class TestGetGitHubHeaders:
+    """Tests for GitHub headers generation."""
 
-class TestGetRepoInfo:
-    """Tests for getting repo info from GitHub API."""
+    def test_headers_without_token(self, monkeypatch):
+        """Test headers without token."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        headers = get_github_headers()
+        assert "Accept" in headers
+        assert "User-Agent" in headers
+        assert "Authorization" not in headers
 
-    @patch("src.api.services.github.requests.get")
-    def test_successful_request(self, mock_get):
-        """Test successful API request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"name": "repo", "full_name": "owner/repo"}
-        mock_get.return_value = mock_response
+    def test_headers_with_token(self, monkeypatch):
+        """Test headers with token."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+        headers = get_github_headers()
+        assert "Accept" in headers
+        assert "User-Agent" in headers
+        assert headers["Authorization"] == "token test-token"
 
-        result = get_repo_info("owner", "repo")
-        assert result == {"name": "repo", "full_name": "owner/repo"}
+    def test_headers_not_shared(self):
+        """Test callers can add headers without affecting later calls."""
+        get_github_headers()["If-None-Match"] = '"abc"'
+        assert "If-None-Match" not in get_github_headers()
 
-    @patch("src.api.services.github.requests.get")
-    def test_failed_request(self, mock_get):
-        """Test failed API request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
 
-        result = get_repo_info("owner", "nonexistent")
-        assert result is None
+class TestExtractRepoInfo:
+    """Tests for extracting repo info from URL."""
 
-    @patch("src.api.services.github.requests.get")
-    def test_exception_handling(self, mock_get):
+    @pytest.mark.parametrize("url,expected", [
+        ("https://github.com/owner/repo", ("owner", "repo")),
+        ("https://github.com/owner/repo.git", ("owner", "repo")),
+        ("https://github.com/owner/repo/", ("owner", "repo")),
+        ("git@github.com:owner/repo.git", ("owner", "repo")),
+        # Only a literal .git suffix is stripped from the repo name
+        ("https://github.com/owner/digit", ("owner", "digit")),
+        ("https://github.com/owner/tig.git", ("owner", "tig")),
+        ("https://gitlab.com/owner/repo", None),
+        ("not a url", None),
+    ], ids=["standard", "git-suffix", "trailing-slash", "ssh", "name-ends-in-git-letters",
+            "name-and-git-suffix", "not-github", "not-a-url"])
+    def test_extract_repo_info(self, url, expected):
+        """Test owner/repo extraction across URL shapes."""
+        assert extract_repo_info(url) == expected
+
+
+class TestGitHubApiHelpers:
+    """Tests for the GitHub API request helpers."""
+
+    @pytest.mark.parametrize("func,args,payload", [
+        (get_repo_info, ("owner", "repo"), {"name": "repo", "full_name": "owner/repo"}),
+        (get_pull_requests, ("owner", "repo"), [{"number": 1}, {"number": 2}]),
+        (get_pr_reviews, ("owner", "repo", 1), [{"state": "APPROVED"}]),
+        (get_commits, ("owner", "repo"), [{"sha": "abc123"}]),
+    ], ids=["repo-info", "pull-requests", "pr-reviews", "commits"])
+    def test_successful_request(self, session_get, func, args, payload):
+        """Test a 200 response returns the decoded JSON."""
+        session_get.return_value = _resp(200, payload)
+
+        assert func(*args) == payload
+
+    @pytest.mark.parametrize("func,args,expected", [
+        (get_repo_info, ("owner", "nonexistent"), None),
+        (get_pull_requests, ("owner", "repo"), []),
+        (get_pr_reviews, ("owner", "repo", 1), []),
+        (get_commits, ("owner", "repo"), []),
+    ], ids=["repo-info", "pull-requests", "pr-reviews", "commits"])
+    def test_failed_request(self, session_get, func, args, expected):
+        """Test a non-200 response returns None (repo info) or an empty list."""
+        session_get.return_value = _resp(404)
+
+        assert func(*args) == expected
+
+    def test_exception_handling(self, session_get):
         """Test exception handling."""
-        mock_get.side_effect = Exception("Connection error")
+        session_get.side_effect = Exception("Connection error")
         result = get_repo_info("owner", "repo")
         assert result is None
 
+    def test_successful_response_cached(self, session_get):
+        """Test repeated lookups of one repo reuse the cached response."""
+        session_get.return_value = _resp(200, [{"sha": "abc123"}])
 
-class TestGetPullRequests:
-    """Tests for getting pull requests."""
-
-    @patch("src.api.services.github.requests.get")
-    def test_successful_request(self, mock_get):
-        """Test successful API request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{"number": 1}, {"number": 2}]
-        mock_get.return_value = mock_response
-
-        result = get_pull_requests("owner", "repo")
-        assert len(result) == 2
-
-    @patch("src.api.services.github.requests.get")
-    def test_failed_request(self, mock_get):
-        """Test failed API request returns empty list."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
-
-        result = get_pull_requests("owner", "repo")
-        assert result == []
-
+        assert get_commits("owner", "repo") == get_commits("owner", "repo")
+        assert session_get.call_count == 1
 
-class TestGetPRReviews:
-    """Tests for getting PR reviews."""
-
-    @patch("src.api.services.github.requests.get")
-    def test_successful_request(self, mock_get):
-        """Test successful API request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{"state": "APPROVED"}]
-        mock_get.return_value = mock_response
-
-        result = get_pr_reviews("owner", "repo", 1)
-        assert len(result) == 1
-
-    @patch("src.api.services.github.requests.get")
-    def test_failed_request(self, mock_get):
-        """Test failed API request returns empty list."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
-
-        result = get_pr_reviews("owner", "repo", 1)
-        assert result == []
-
-
-class TestGetCommits:
-    """Tests for getting commits."""
-
-    @patch("src.api.services.github.requests.get")
-    def test_successful_request(self, mock_get):
-        """Test successful API request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{"sha": "abc123"}]
-        mock_get.return_value = mock_response
-
-        result = get_commits("owner", "repo")
-        assert len(result) == 1
-
-    @patch("src.api.services.github.requests.get")
-    def test_failed_request(self, mock_get):
-        """Test failed API request returns empty list."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+    def test_etag_304_returns_cached(self, session_get):
+        """Test a 304 reply to If-None-Match returns the stored body."""
+        not_modified = _resp(304)
+        not_modified.json = lambda: pytest.fail("304 body must not be parsed")
+        session_get.side_effect = [
+            _resp(200, {"name": "repo"}, headers={"ETag": '"abc"'}),
+            not_modified,
+        ]
 
-        result = get_commits("owner", "repo")
-        assert result == []
+        assert get_repo_info("owner", "repo") == {"name": "repo"}
+        github_module._fetch_json_cached.cache_clear()  # Expire the TTL cache
+        assert get_repo_info("owner", "repo") == {"name": "repo"}
+        assert session_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    def test_failed_response_not_cached(self, session_get):
+        """Test a failed request is retried on the next lookup."""
+        session_get.side_effect = [_resp(503), _resp(200, {"name": "repo"})]
+
+        assert get_repo_info("owner", "repo") is None
+        assert get_repo_info("owner", "repo") == {"name": "repo"}
+
+
+class TestGraphQLRepoReviewedness:
+    """Tests for the batched GraphQL review count."""
+
+    def test_no_token_skips_request(self, monkeypatch):
+        """Test GraphQL is not attempted without a token."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        with patch.object(github_module._session, "post") as mock_post:
+            assert graphql_repo_reviewedness("owner", "repo") is None
+        mock_post.assert_not_called()
+
+    def test_counts_reviewed_prs(self, monkeypatch):
+        """Test reviewed and merged PR counts are read from the response."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+        nodes = [{"reviews": {"totalCount": n}} for n in (2, 0, 1)]
+        payload = {"data": {"repository": {"pullRequests": {"nodes": nodes}}}}
+        with patch.object(github_module._session, "post", return_value=_resp(200, payload)) as mock_post:
+            assert graphql_repo_reviewedness("owner", "repo") == (2, 3)
+        # Same PR sample size as the REST fallback
+        assert mock_post.call_args.kwargs["json"]["variables"]["first"] == github_module._MAX_MERGED_PRS
+
+    @pytest.mark.parametrize("response", [
+        _resp(401),
+        _resp(200, {"data": {"repository": None}, "errors": [{"type": "NOT_FOUND"}]}),
+    ], ids=["unauthorized", "not-found"])
+    def test_failure_returns_none(self, monkeypatch, response):
+        """Test HTTP errors and missing repositories return None."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+        with patch.object(github_module._session, "post", return_value=response):
+            assert graphql_repo_reviewedness("owner", "repo") is None
 
 
 class TestComputeReviewednessForRepo:
@@ -183,83 +201,51 @@ class TestComputeReviewednessForRepo:
         result = compute_reviewedness_for_repo("not a github url")
         assert result == -1.0
 
-    @patch("src.api.services.github.get_repo_info")
-    def test_repo_not_found(self, mock_repo_info):
-        """Test repo not found returns -1."""
-        mock_repo_info.return_value = None
+    def test_graphql_counts_used(self, github_api):
+        """Test GraphQL review counts skip the per-PR REST calls."""
+        github_api["graphql_repo_reviewedness"].return_value = (1, 2)
+
         result = compute_reviewedness_for_repo("https://github.com/owner/repo")
-        assert result == -1.0
+        assert result == 0.5
+        github_api["get_pr_reviews"].assert_not_called()
 
-    @patch("src.api.services.github.get_repo_info")
-    @patch("src.api.services.github.get_pull_requests")
-    @patch("src.api.services.github.get_commits")
-    def test_no_prs_with_commits(self, mock_commits, mock_prs, mock_repo_info):
-        """Test repo with no PRs but has commits returns 0.1."""
-        mock_repo_info.return_value = {"name": "repo"}
-        mock_prs.return_value = []
-        mock_commits.return_value = [{"sha": "abc"}]
+    def test_graphql_no_merged_prs_falls_back(self, github_api):
+        """Test zero merged PRs from GraphQL falls back to the REST path."""
+        github_api["graphql_repo_reviewedness"].return_value = (0, 0)
+        github_api["get_repo_info"].return_value = {"name": "repo"}
+        github_api["get_commits"].return_value = [{"sha": "abc"}]
 
         result = compute_reviewedness_for_repo("https://github.com/owner/repo")
         assert result == 0.1
 
-    @patch("src.api.services.github.get_repo_info")
-    @patch("src.api.services.github.get_pull_requests")
-    @patch("src.api.services.github.get_commits")
-    def test_no_prs_no_commits(self, mock_commits, mock_prs, mock_repo_info):
-        """Test repo with no PRs and no commits returns -1."""
-        mock_repo_info.return_value = {"name": "repo"}
-        mock_prs.return_value = []
-        mock_commits.return_value = []
-
+    def test_repo_not_found(self, github_api):
+        """Test repo not found returns -1."""
         result = compute_reviewedness_for_repo("https://github.com/owner/repo")
         assert result == -1.0
 
-    @patch("src.api.services.github.get_repo_info")
-    @patch("src.api.services.github.get_pull_requests")
-    @patch("src.api.services.github.get_pr_reviews")
-    def test_all_prs_reviewed(self, mock_reviews, mock_prs, mock_repo_info):
-        """Test all merged PRs reviewed returns 1.0."""
-        mock_repo_info.return_value = {"name": "repo"}
-        mock_prs.return_value = [
-            {"number": 1, "merged_at": "2023-01-01"},
-            {"number": 2, "merged_at": "2023-01-02"},
-        ]
-        mock_reviews.return_value = [{"state": "APPROVED"}]
-
-        result = compute_reviewedness_for_repo("https://github.com/owner/repo")
-        assert result == 1.0
-
-    @patch("src.api.services.github.get_repo_info")
-    @patch("src.api.services.github.get_pull_requests")
-    @patch("src.api.services.github.get_pr_reviews")
-    def test_half_prs_reviewed(self, mock_reviews, mock_prs, mock_repo_info):
-        """Test half merged PRs reviewed returns 0.5."""
-        mock_repo_info.return_value = {"name": "repo"}
-        mock_prs.return_value = [
-            {"number": 1, "merged_at": "2023-01-01"},
-            {"number": 2, "merged_at": "2023-01-02"},
-        ]
+    @pytest.mark.parametrize("prs,reviews_by_pr,commits,expected", [
+        # No PRs, but commits exist: some code, no PR workflow
+        ([], {}, [{"sha": "abc"}], 0.1),
+        # No PRs and no commits
+        ([], {}, [], -1.0),
+        # Every merged PR reviewed
+        ([{"number": 1, "merged_at": "2023-01-01"}, {"number": 2, "merged_at": "2023-01-02"}],
+         {1: [{"state": "APPROVED"}], 2: [{"state": "APPROVED"}]}, [], 1.0),
         # First PR has review, second doesn't
-        mock_reviews.side_effect = [
-            [{"state": "APPROVED"}],
-            [],
-        ]
-
-        result = compute_reviewedness_for_repo("https://github.com/owner/repo")
-        assert result == 0.5
-
-    @patch("src.api.services.github.get_repo_info")
-    @patch("src.api.services.github.get_pull_requests")
-    def test_unmerged_prs(self, mock_prs, mock_repo_info):
-        """Test PRs without merged_at are not counted."""
-        mock_repo_info.return_value = {"name": "repo"}
-        mock_prs.return_value = [
-            {"number": 1, "merged_at": None},  # Not merged
-            {"number": 2},  # No merged_at field
-        ]
+        ([{"number": 1, "merged_at": "2023-01-01"}, {"number": 2, "merged_at": "2023-01-02"}],
+         {1: [{"state": "APPROVED"}]}, [], 0.5),
+        # PRs exist but none merged (merged_at None or missing)
+        ([{"number": 1, "merged_at": None}, {"number": 2}], {}, [], 0.2),
+    ], ids=["no-prs-with-commits", "no-prs-no-commits", "all-reviewed", "half-reviewed", "unmerged"])
+    def test_rest_reviewedness(self, github_api, prs, reviews_by_pr, commits, expected):
+        """Test the REST path's score for each repository shape."""
+        github_api["get_repo_info"].return_value = {"name": "repo"}
+        github_api["get_pull_requests"].return_value = prs
+        github_api["get_pr_reviews"].side_effect = lambda owner, repo, n: reviews_by_pr.get(n, [])
+        github_api["get_commits"].return_value = commits
 
         result = compute_reviewedness_for_repo("https://github.com/owner/repo")
-        assert result == 0.2  # PRs exist but none merged
+        assert result == expected
 
 
 class TestFindGitHubUrlForModel:
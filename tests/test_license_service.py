@@ -1,8 +1,12 @@
 """Tests for the license service."""
 
 import pytest
+import requests
+from itertools import product
 from unittest.mock import patch, MagicMock
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 
+from src.api.services import license as license_module
 from src.api.services.license import (
     normalize_license,
     detect_license_from_content,
@@ -11,74 +15,68 @@ from src.api.services.license import (
     LICENSE_COMPATIBILITY,
 )
 
+def _raw_file(text):
+    """A streamed 200 response for a raw LICENSE file."""
+    response = MagicMock(status_code=200, encoding="utf-8")
+    response.iter_content.return_value = iter([text.encode()])
+    return response
+
+
+_PERMISSIVE = ("mit", "apache-2.0", "bsd-2-clause", "bsd-3-clause", "isc")
+
 
 class TestNormalizeLicense:
     """Tests for license normalization."""
 
-    def test_normalize_none(self):
-        """Test normalizing None."""
-        assert normalize_license(None) is None
-
-    def test_normalize_empty_string(self):
-        """Test normalizing empty string."""
-        assert normalize_license("") is None
-
-    def test_normalize_mit_variants(self):
-        """Test normalizing MIT license variants."""
-        assert normalize_license("mit") == "mit"
-        assert normalize_license("MIT") == "mit"
-        assert normalize_license("MIT License") == "mit"
-        assert normalize_license("expat") == "mit"
-
-    def test_normalize_apache_variants(self):
-        """Test normalizing Apache license variants."""
-        assert normalize_license("apache-2.0") == "apache-2.0"
-        assert normalize_license("Apache 2.0") == "apache-2.0"
-        assert normalize_license("Apache License 2.0") == "apache-2.0"
-        assert normalize_license("Apache License, Version 2.0") == "apache-2.0"
-
-    def test_normalize_bsd_variants(self):
-        """Test normalizing BSD license variants."""
-        assert normalize_license("bsd-2-clause") == "bsd-2-clause"
-        assert normalize_license("bsd 2-clause") == "bsd-2-clause"
-        assert normalize_license("simplified bsd") == "bsd-2-clause"
-        assert normalize_license("bsd-3-clause") == "bsd-3-clause"
-        assert normalize_license("new bsd") == "bsd-3-clause"
-
-    def test_normalize_gpl_variants(self):
-        """Test normalizing GPL license variants."""
-        assert normalize_license("gpl-2.0") == "gpl-2.0"
-        assert normalize_license("GPL 2.0") == "gpl-2.0"
-        assert normalize_license("GNU GPL v2") == "gpl-2.0"
-        assert normalize_license("gpl-3.0") == "gpl-3.0"
-        assert normalize_license("GNU General Public License v3.0") == "gpl-3.0"
-
-    def test_normalize_lgpl_variants(self):
-        """Test normalizing LGPL license variants."""
-        assert normalize_license("lgpl-2.1") == "lgpl-2.1"
-        assert normalize_license("lgpl-3.0") == "lgpl-3.0"
-
-    def test_normalize_public_domain(self):
-        """Test normalizing public domain licenses."""
-        assert normalize_license("unlicense") == "unlicense"
-        assert normalize_license("public domain") == "unlicense"
-        assert normalize_license("cc0-1.0") == "cc0-1.0"
-
-    def test_normalize_creative_commons(self):
-        """Test normalizing Creative Commons licenses."""
-        assert normalize_license("cc-by-4.0") == "cc-by-4.0"
-        assert normalize_license("cc by 4.0") == "cc-by-4.0"
-        assert normalize_license("cc-by-sa-4.0") == "cc-by-sa-4.0"
-
-    def test_normalize_other_licenses(self):
-        """Test normalizing other licenses."""
-        assert normalize_license("isc") == "isc"
-        assert normalize_license("ISC License") == "isc"
-        assert normalize_license("mpl-2.0") == "mpl-2.0"
-
-    def test_normalize_unknown_returns_lowercase(self):
-        """Test that unknown licenses are returned as lowercase."""
-        assert normalize_license("Some Unknown License") == "some unknown license"
+    @pytest.mark.parametrize("raw,expected", [
+        # Missing
+        (None, None),
+        ("", None),
+        # MIT variants
+        ("mit", "mit"),
+        ("MIT", "mit"),
+        ("MIT License", "mit"),
+        ("expat", "mit"),
+        # Apache variants
+        ("apache-2.0", "apache-2.0"),
+        ("Apache 2.0", "apache-2.0"),
+        ("Apache License 2.0", "apache-2.0"),
+        ("Apache License, Version 2.0", "apache-2.0"),
+        # BSD variants
+        ("bsd-2-clause", "bsd-2-clause"),
+        ("bsd 2-clause", "bsd-2-clause"),
+        ("simplified bsd", "bsd-2-clause"),
+        ("bsd-3-clause", "bsd-3-clause"),
+        ("new bsd", "bsd-3-clause"),
+        # GPL variants
+        ("gpl-2.0", "gpl-2.0"),
+        ("GPL 2.0", "gpl-2.0"),
+        ("GNU GPL v2", "gpl-2.0"),
+        ("gpl-3.0", "gpl-3.0"),
+        ("GNU General Public License v3.0", "gpl-3.0"),
+        # LGPL variants
+        ("lgpl-2.1", "lgpl-2.1"),
+        ("lgpl-3.0", "lgpl-3.0"),
+        # Public domain
+        ("unlicense", "unlicense"),
+        ("public domain", "unlicense"),
+        ("cc0-1.0", "cc0-1.0"),
+        # Creative Commons
+        ("cc-by-4.0", "cc-by-4.0"),
+        ("cc by 4.0", "cc-by-4.0"),
+        ("cc-by-sa-4.0", "cc-by-sa-4.0"),
+        # Other
+        ("isc", "isc"),
+        ("ISC License", "isc"),
+        ("mpl-2.0", "mpl-2.0"),
+        # Surrounding whitespace is ignored
+        ("  MIT License\n", "mit"),
+        # Unknown licenses are returned lowercased
+        ("Some Unknown License", "some unknown license"),
+    ])
+    def test_normalize_license(self, raw, expected):
+        """Test normalizing license strings to standard identifiers."""
+        assert normalize_license(raw) == expected
 
 
 class TestDetectLicenseFromContent:
@@ -166,13 +164,11 @@ class TestCheckCompatibility:
         is_compat, msg = check_compatibility("gpl-3.0", "mit")
         assert is_compat is False
 
-    def test_permissive_licenses_compatible(self):
+    @pytest.mark.parametrize("lic1,lic2", list(product(_PERMISSIVE, repeat=2)))
+    def test_permissive_licenses_compatible(self, lic1, lic2):
         """Test permissive licenses are compatible with each other."""
-        permissive = ["mit", "apache-2.0", "bsd-2-clause", "bsd-3-clause", "isc"]
-        for lic1 in permissive:
-            for lic2 in permissive:
-                is_compat, _ = check_compatibility(lic1, lic2)
-                assert is_compat is True, f"{lic1} should be compatible with {lic2}"
+        is_compat, _ = check_compatibility(lic1, lic2)
+        assert is_compat is True, f"{lic1} should be compatible with {lic2}"
 
     def test_reverse_compatibility(self):
         """Test reverse compatibility check."""
@@ -188,7 +184,7 @@ class TestFetchGitHubLicense:
         """Test invalid URL returns None."""
         assert fetch_github_license("not a github url") is None
 
-    @patch("src.api.services.license.requests.get")
+    @patch.object(license_module._session, "get")
     def test_api_success(self, mock_get):
         """Test successful API response."""
         mock_response = MagicMock()
@@ -201,27 +197,84 @@ class TestFetchGitHubLicense:
         result = fetch_github_license("https://github.com/owner/repo")
         assert result == "MIT"
 
-    @patch("src.api.services.license.requests.get")
+    @patch.object(license_module._session, "get")
     def test_api_failure_fallback(self, mock_get):
         """Test fallback to raw LICENSE file on API failure."""
-        # First call fails (API), subsequent calls return license content
-        responses = [
-            MagicMock(status_code=404),  # API call
-            MagicMock(status_code=404),  # main/LICENSE
-            MagicMock(status_code=404),  # main/LICENSE.md
-            MagicMock(status_code=404),  # main/LICENSE.txt
-            MagicMock(status_code=404),  # master/LICENSE
-            MagicMock(status_code=200, text="MIT License\nPermission is hereby granted..."),
-        ]
-        mock_get.side_effect = responses
+        # API and every raw path 404 except master/LICENSE.md
+        def fake_get(url, **kwargs):
+            if url.endswith("/master/LICENSE.md"):
+                return _raw_file("MIT License\nPermission is hereby granted...")
+            return MagicMock(status_code=404)
+        mock_get.side_effect = fake_get
 
         result = fetch_github_license("https://github.com/owner/repo")
         assert result == "mit"
-
-    @patch("src.api.services.license.requests.get")
+        assert mock_get.call_count == 7  # API + six probes
+
+    @patch.object(license_module._session, "get")
+    def test_fallback_reads_only_file_head(self, mock_get):
+        """Test raw LICENSE files are streamed and only their start is read."""
+        license_file = _raw_file("MIT License")
+        mock_get.side_effect = lambda url, **kwargs: (
+            license_file if url.endswith("/main/LICENSE") else MagicMock(status_code=404)
+        )
+
+        assert fetch_github_license("https://github.com/owner/repo") == "mit"
+        license_file.iter_content.assert_called_once_with(license_module._LICENSE_HEAD_BYTES)
+        license_file.close.assert_called_once()
+        assert mock_get.call_args_list[1].kwargs["stream"] is True
+
+    @patch.object(license_module._session, "get")
+    def test_fallback_prefers_earlier_path(self, mock_get):
+        """Test the first existing LICENSE path in priority order wins."""
+        def fake_get(url, **kwargs):
+            if url.endswith("/main/LICENSE.txt"):
+                return _raw_file("This is free and unencumbered software")
+            if url.endswith("/master/LICENSE"):
+                return _raw_file("MIT License")
+            return MagicMock(status_code=404)
+        mock_get.side_effect = fake_get
+
+        assert fetch_github_license("https://github.com/owner/repo") == "unlicense"
+
+    @pytest.mark.parametrize("url,repo", [
+        ("https://github.com/owner/digit", "digit"),
+        ("https://github.com/owner/repo.git", "repo"),
+        ("https://github.com/owner/repo/tree/main", "repo"),
+        ("https://github.com/owner/repo.github.io", "repo.github.io"),
+    ], ids=["git-letters", "git-suffix", "subpath", "dotted-name"])
+    @patch.object(license_module._session, "get")
+    def test_repo_name_parsing(self, mock_get, url, repo):
+        """Test only a literal .git suffix or sub-path is dropped from the repo name."""
+        mock_get.return_value = MagicMock(status_code=200, json=lambda: {"license": {"spdx_id": "MIT"}})
+
+        fetch_github_license(url)
+        assert mock_get.call_args.args[0] == f"https://api.github.com/repos/owner/{repo}/license"
+
+    @pytest.mark.parametrize("error", [
+        ProtocolError("Connection broken"),
+        ReadTimeoutError(None, "/LICENSE", "Read timed out."),
+    ], ids=["protocol-error", "read-timeout"])
+    @patch.object(license_module._session, "get")
+    def test_fallback_read_error(self, mock_get, error):
+        """Test a raw LICENSE body that fails mid-read counts as missing."""
+        def fake_get(url, **kwargs):
+            if url.endswith("/main/LICENSE"):
+                # A real Response, so requests wraps the urllib3 read error
+                response = requests.Response()
+                response.status_code = 200
+                response.raw = MagicMock()
+                response.raw.read.side_effect = error
+                response.raw.stream.side_effect = error
+                return response
+            return MagicMock(status_code=404)
+        mock_get.side_effect = fake_get
+
+        assert fetch_github_license("https://github.com/owner/repo") is None
+
+    @patch.object(license_module._session, "get")
     def test_request_exception(self, mock_get):
         """Test handling of request exceptions."""
-        import requests
         mock_get.side_effect = requests.RequestException("Connection error")
 
         result = fetch_github_license("https://github.com/owner/repo")
@@ -231,21 +284,14 @@ class TestFetchGitHubLicense:
 class TestLicenseCompatibilityMap:
     """Tests for the license compatibility map."""
 
-    def test_permissive_licenses_exist(self):
-        """Test that permissive licenses are in the map."""
-        assert "mit" in LICENSE_COMPATIBILITY
-        assert "apache-2.0" in LICENSE_COMPATIBILITY
-        assert "bsd-2-clause" in LICENSE_COMPATIBILITY
-        assert "bsd-3-clause" in LICENSE_COMPATIBILITY
-
-    def test_copyleft_licenses_exist(self):
-        """Test that copyleft licenses are in the map."""
-        assert "gpl-2.0" in LICENSE_COMPATIBILITY
-        assert "gpl-3.0" in LICENSE_COMPATIBILITY
-        assert "lgpl-2.1" in LICENSE_COMPATIBILITY
-
-    def test_creative_commons_exist(self):
-        """Test that Creative Commons licenses are in the map."""
-        assert "cc-by-4.0" in LICENSE_COMPATIBILITY
-        assert "cc-by-sa-4.0" in LICENSE_COMPATIBILITY
-
+    @pytest.mark.parametrize("name", [
+        # Permissive
+        "mit", "apache-2.0", "bsd-2-clause", "bsd-3-clause",
+        # Copyleft
+        "gpl-2.0", "gpl-3.0", "lgpl-2.1",
+        # Creative Commons
+        "cc-by-4.0", "cc-by-sa-4.0",
+    ])
+    def test_license_in_map(self, name):
+        """Test that each well-known license has a compatibility entry."""
+        assert name in LICENSE_COMPATIBILITY
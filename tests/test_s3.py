@@ -1,20 +1,52 @@
 """Tests for S3 storage adapter."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 import os
 
+from src.api.storage import s3
+
+
+@pytest.fixture(autouse=True)
+def _reset_s3_client(monkeypatch):
+    """Start each test without a cached S3 client (restored afterwards)."""
+    monkeypatch.setattr(s3, "_s3_client", None)
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    """
+    A stub S3 client returned by get_s3_client for one test.
+
+    Methods return a canned value; each call is recorded in .calls as
+    (method name, kwargs).
+    """
+    calls = []
+
+    def method(name, result=None):
+        def call(*args, **kwargs):
+            calls.append((name, kwargs))
+            return result
+        return call
+
+    client = SimpleNamespace(
+        calls=calls,
+        put_object=method("put_object"),
+        upload_fileobj=method("upload_fileobj"),
+        head_bucket=method("head_bucket"),
+        delete_object=method("delete_object"),
+        generate_presigned_url=method("generate_presigned_url", "https://presigned.url/test"),
+    )
+    monkeypatch.setattr(s3, "get_s3_client", lambda: client)
+    return client
+
 
 class TestS3Adapter:
     """Test S3 adapter functions."""
 
     def test_get_download_url_no_client(self):
         """Test get_download_url returns placeholder when no client."""
-        from src.api.storage import s3
-
-        # Reset client
-        s3._s3_client = None
-
         with patch.dict(os.environ, {}, clear=True):
             with patch('src.api.storage.s3.get_s3_client', return_value=None):
                 url = s3.get_download_url("test/key")
@@ -23,65 +55,57 @@ class TestS3Adapter:
 
     def test_check_health_no_client(self):
         """Test check_health returns False when no client."""
-        from src.api.storage import s3
-
         with patch('src.api.storage.s3.get_s3_client', return_value=None):
             result = s3.check_health()
             assert result is False
 
     def test_delete_object_no_client(self):
         """Test delete_object returns False when no client."""
-        from src.api.storage import s3
-
         with patch('src.api.storage.s3.get_s3_client', return_value=None):
             result = s3.delete_object("test/key")
             assert result is False
 
     def test_upload_object_no_client_raises(self):
         """Test upload_object raises when no client."""
-        from src.api.storage import s3
-
         with patch('src.api.storage.s3.get_s3_client', return_value=None):
             with pytest.raises(RuntimeError, match="not configured"):
                 s3.upload_object("test/key", b"data")
 
-    @patch('src.api.storage.s3.get_s3_client')
-    def test_upload_object_success(self, mock_get_client):
+    def test_upload_object_success(self, fake_s3):
         """Test successful upload."""
-        from src.api.storage import s3
-
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
         result = s3.upload_object("test/key", b"test data")
 
         assert result == "test/key"
-        mock_client.put_object.assert_called_once()
+        assert [name for name, _ in fake_s3.calls] == ["put_object"]
 
-    @patch('src.api.storage.s3.get_s3_client')
-    def test_check_health_success(self, mock_get_client):
-        """Test health check success."""
-        from src.api.storage import s3
+    def test_upload_object_large_uses_multipart(self, fake_s3):
+        """Test blobs above the threshold go through the transfer manager."""
+        data = b"x" * (s3.MULTIPART_THRESHOLD + 1)
+        result = s3.upload_object("test/large", data)
 
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+        assert result == "test/large"
+        assert [name for name, _ in fake_s3.calls] == ["upload_fileobj"]
+        assert fake_s3.calls[0][1]["Config"] is s3.get_transfer_config()
 
+    def test_check_health_success(self, fake_s3):
+        """Test health check success."""
         result = s3.check_health()
 
         assert result is True
-        mock_client.head_bucket.assert_called_once()
+        assert [name for name, _ in fake_s3.calls] == ["head_bucket"]
 
-    @patch('src.api.storage.s3.get_s3_client')
-    def test_get_download_url_presigned(self, mock_get_client):
+    def test_get_download_url_presigned(self, fake_s3):
         """Test presigned URL generation."""
-        from src.api.storage import s3
-
-        mock_client = MagicMock()
-        mock_client.generate_presigned_url.return_value = "https://presigned.url/test"
-        mock_get_client.return_value = mock_client
-
         result = s3.get_download_url("test/key")
 
         assert result == "https://presigned.url/test"
-        mock_client.generate_presigned_url.assert_called_once()
+        assert [name for name, _ in fake_s3.calls] == ["generate_presigned_url"]
+
+    def test_get_s3_client_uses_tuned_config(self):
+        """Test client is created with pool and retry configuration."""
+        with patch('boto3.client') as mock_client:
+            s3.get_s3_client()
 
+        config = mock_client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 64
+        assert config.retries["mode"] == "adaptive"